@@ -6,15 +6,32 @@ Converts markdown to HTML with minimal dependencies.
 
 import os
 import re
+import gzip
+import json
 import shutil
+import time
+import hashlib
+import argparse
+import logging
+import bisect
+import heapq
+import itertools
+import functools
+import threading
+import contextlib
+import unicodedata
+import http.server
 import html as html_lib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
+from collections import Counter, defaultdict
+from typing import NamedTuple
 import markdown
-from markdown.extensions.codehilite import CodeHiliteExtension
-from markdown.extensions.fenced_code import FencedCodeExtension
-from markdown.extensions.tables import TableExtension
-from markdown.extensions.toc import TocExtension
+import pygments
+from markdown.extensions import codehilite
+from pygments import highlight
+from pygments.lexers import get_lexer_by_name
 
 # Paths
 ROOT = Path(__file__).parent
@@ -22,13 +39,160 @@ SRC = ROOT / "src"
 CONTENT = SRC / "content"
 TEMPLATES = SRC / "templates"
 CSS = SRC / "css"
+JS = SRC / "js"
 BLOG = ROOT / "docs" / "blog"  # Keep existing blog posts
 ASSETS = ROOT / "docs" / "assets"
 OUTPUT = ROOT / "dist"
+CACHE = ROOT / ".cache"
+MANIFEST = CACHE / "build-manifest.json"
+DEPLOY_DELTA = CACHE / "deploy-delta.json"
+RENDER_CACHE = CACHE / "render"
+SEARCH_CACHE = CACHE / "search.json"
+FONT_CACHE = CACHE / "fonts"
+IMAGE_CACHE = CACHE / "images"
+
+# Markdown sources per section, discovered in one pass by iter_content()
+CONTENT_SECTIONS = {
+    "blog": BLOG,
+    "wegoch": CONTENT / "wegoch",
+    "getem": CONTENT / "getem",
+    "geez": CONTENT / "geez",
+    "cs": CONTENT / "cs",
+}
 
 # Site config
 SITE_URL = "https://esubalew.dev"
 
+# Markdown configuration; also part of every rendered-HTML cache key
+MARKDOWN_EXTENSIONS = ["codehilite", "fenced_code", "tables", "toc", "smarty"]
+MARKDOWN_EXTENSION_CONFIGS = {
+    "codehilite": {"css_class": "highlight", "linenums": False},
+    "toc": {"permalink": False},
+}
+
+# Rendered-HTML cache: least recently used entries are evicted above this size
+USE_RENDER_CACHE = True
+RENDER_CACHE_LIMIT = 256 * 1024 * 1024
+
+# Template placeholders: {{name}}
+PLACEHOLDER = re.compile(r'\{\{([^}]+)\}\}')
+
+# Incremental build state: fingerprints from the previous build and this one
+INCREMENTAL = False
+_manifest = {"version": "", "outputs": {}, "sources": {}, "digests": {}}
+_outputs = {}
+_previous_outputs = set()  # every output of the previous build, even when its fingerprint is stale
+_sources = {}
+_glyphs = set()  # every character written to an HTML page, for font subsetting
+
+# Output layer: files in dist/ are replaced atomically and only when their bytes
+# change. The manifest keeps [size, mtime_ns, sha256] for every file in dist/;
+# a full build removes whatever it did not produce instead of deleting dist/ first.
+_digests = {}
+_produced = set()
+
+# Static sync: confirm same-size files by content hash; hard-link instead of copying
+SYNC_HASH = False
+SYNC_LINK = False
+
+# Font subsetting: css/fonts.css is regenerated to serve WOFF2 subsets of the
+# TTFs in docs/assets holding only the characters the pages use (plus ASCII)
+SUBSET_FONTS = True
+FONTS_CSS = "fonts.css"
+FONT_FACE = re.compile(r'@font-face\s*\{[^}]*\}')
+FONT_SRC = re.compile(r"src:\s*url\('/assets/([^']+\.ttf)'\)\s*format\('truetype'\);")
+SUBSET_ALWAYS = frozenset(range(0x20, 0x7F))
+# The full TTF stays declared for the rest of each font's charset, with runs
+# this close merged so the range stays short
+FONT_FALLBACK_GAP = 128
+
+# Responsive images: misloch pictures get resized WebP (and AVIF, where Pillow can
+# encode it) variants at these widths, cached in .cache/images/ by source hash
+IMAGE_WIDTHS = (280, 560, 840, 1520)
+IMAGE_SUFFIXES = {".png", ".jpg", ".jpeg"}
+IMAGE_QUALITY = {"webp": 80, "avif": 60}
+IMAGE_SIZES = {
+    "work": "(max-width: 640px) 200px, 280px",
+    "geez": "(max-width: 800px) 100vw, 760px",
+}
+IMG_TAG = re.compile(r'<img\b[^>]*?\bsrc="([^"]+)"[^>]*>')
+_images = {}  # original URL -> ImageInfo
+
+# Precompression (--compress): .gz and .br siblings for text files in dist/,
+# stamped with the source's mtime so unchanged files are skipped next build
+COMPRESS = False
+COMPRESSIBLE = {".html", ".css", ".js", ".json", ".xml", ".svg", ".txt"}
+COMPRESSED_SUFFIXES = (".gz", ".br")
+COMPRESS_MIN_SIZE = 256
+
+# Minification (--minify) of HTML pages and stylesheets. <pre>, <textarea>,
+# <script> and <style> contents and quoted CSS strings are left untouched.
+MINIFY = False
+HTML_PRESERVE = re.compile(r'(<(pre|textarea|script|style)\b[^>]*>.*?</\2>)', re.S | re.I)
+HTML_COMMENT = re.compile(r'<!--(?!\[if).*?-->', re.S)
+CSS_STRING = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+CSS_PUNCTUATION = re.compile(r'\s*([{};,>])\s*')
+WHITESPACE = re.compile(r'\s+')
+
+# Critical CSS (--critical-css): each page inlines the rules its first
+# CRITICAL_FOLD characters of <body> use, and loads its stylesheets asynchronously
+CRITICAL_CSS = False
+CRITICAL_FOLD = 6000
+STYLESHEET_LINK = re.compile(r'<link rel="stylesheet" href="/css/([^"]+\.css)" />')
+SELECTOR_INTERACTIVE = re.compile(r':(?:hover|focus|focus-visible|focus-within|active|visited)\b')
+SELECTOR_IGNORED = re.compile(r'::?[a-zA-Z-]+(?:\([^)]*\))?|\[[^\]]*\]|\*')
+SELECTOR_TOKEN = re.compile(r'([.#]?)(-?[_a-zA-Z][\w-]*)')
+HTML_TAG = re.compile(r'<([a-zA-Z][a-zA-Z0-9-]*)')
+HTML_CLASS = re.compile(r'\bclass="([^"]*)"')
+HTML_ID = re.compile(r'\bid="([^"]*)"')
+
+# Size limits in bytes for each HTML page as written, by top-level directory;
+# a page over its budget fails the build
+PAGE_BUDGET = 64 * 1024
+PAGE_BUDGETS = {"blog": 160 * 1024, "cs": 160 * 1024}
+_over_budget = []
+
+# List pages: the blog and works indexes hold PAGE_SIZE entries each, continued
+# at /<section>/page/N; the blog also has an archive per year at /blog/<year>
+PAGE_SIZE = 100
+HOME_POSTS = 10
+
+# Sitemaps: sitemap.xml is an index of child sitemaps written as URLs are
+# produced, each within the protocol's limits; --gzip-sitemaps writes them as .xml.gz
+SITEMAP_LIMIT = 50_000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+SITEMAP_GZIP = False
+SITEMAP_XMLNS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+# Feeds: Atom (feed.xml) and JSON Feed (feed.json) for each dated section and
+# for all of them combined at the site root, holding the newest FEED_LIMIT entries
+FEED_SECTIONS = {"blog": "Blog", "cs": "CS", "wegoch": "ወጎች", "getem": "ግጥሞች"}
+FEED_LIMIT = 20
+FEED_AUTHOR = "Esubalew Chekol"
+
+# Search index: dist/search/index.json lists documents and shards; each shard in
+# dist/search/shards/ maps the terms starting with one character to flat
+# [doc, score, doc, score, ...] postings. src/js/search.js mirrors the tokenizer.
+SEARCH_WEIGHTS = {"title": 8, "keywords": 4, "description": 2, "body": 1}
+SEARCH_BODY_CAP = 5
+SEARCH_SNIPPET = 160
+SEARCH_TERM = re.compile(r"[^\W_]+")
+SEARCH_MARKUP = re.compile(r"<[^>]+>|\]\([^)]*\)|https?://\S+")
+# Ethiopic homophone series spelled interchangeably fold to one: ሐ/ኀ to ሀ, ሠ to ሰ, ዐ to አ, ፀ to ጸ
+ETHIOPIC_FOLD = {
+    source + order: target + order
+    for source, target in ((0x1210, 0x1200), (0x1280, 0x1200), (0x1220, 0x1230), (0x12D0, 0x12A0), (0x1340, 0x1338))
+    for order in range(8)
+}
+
+# Parallel rendering across processes; each thread keeps one Markdown converter.
+# Bodies are loaded and rendered RENDER_BATCH pages at a time.
+JOBS = os.cpu_count() or 1
+RENDER_BATCH = 256
+_pool = None
+_converters = threading.local()
+
 
 def humanize_date(date: datetime) -> str:
     """Return a human-readable relative date string."""
@@ -60,9 +224,135 @@ def humanize_date(date: datetime) -> str:
         return f"{years} years ago"
 
 
-def read_template(name: str) -> str:
-    """Read an HTML template."""
-    return (TEMPLATES / name).read_text(encoding="utf-8")
+def hash_inputs(*inputs) -> str:
+    """Return a SHA-256 fingerprint of the given build inputs."""
+    digest = hashlib.sha256()
+    for item in inputs:
+        digest.update(repr(item).encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def build_version() -> str:
+    """Fingerprint of the generator and its output mode; a change invalidates every page.
+    
+    With critical CSS inlined, every page also depends on the stylesheets.
+    """
+    stylesheets = [file_sha256(path) for path in sorted(CSS.glob("*.css"))] if CRITICAL_CSS else []
+    return hash_inputs(Path(__file__).read_text(encoding="utf-8"), MINIFY, CRITICAL_CSS, stylesheets)
+
+
+def load_manifest():
+    """Load fingerprints recorded by the previous build."""
+    global _manifest
+    _outputs.clear()
+    _previous_outputs.clear()
+    _sources.clear()
+    _glyphs.clear()
+    _digests.clear()
+    _produced.clear()
+    _manifest = {"version": "", "outputs": {}, "sources": {}, "digests": {}}
+    try:
+        manifest = json.loads(MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    # Source digests stay valid across generator changes; page fingerprints do not
+    _manifest["sources"] = manifest.get("sources", {})
+    _manifest["digests"] = manifest.get("digests", {})
+    _manifest["compressed"] = manifest.get("compressed", False)
+    # Stale-output removal needs the previous pages whether or not they can be reused
+    _previous_outputs.update(manifest.get("outputs", {}))
+    if manifest.get("version") == build_version():
+        _manifest["version"] = manifest["version"]
+        _manifest["outputs"] = manifest.get("outputs", {})
+        # Pages skipped as unchanged still need their characters in the font subsets
+        if INCREMENTAL:
+            _glyphs.update(manifest.get("glyphs", ""))
+
+
+def save_manifest():
+    """Persist output fingerprints for the next incremental build."""
+    CACHE.mkdir(exist_ok=True)
+    manifest = {
+        "version": build_version(),
+        "outputs": dict(sorted(_outputs.items())),
+        "sources": dict(sorted(_sources.items())),
+        "glyphs": "".join(sorted(_glyphs)),
+        "digests": dict(sorted(_digests.items())),
+        "compressed": COMPRESS,
+    }
+    MANIFEST.write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+
+
+def source_digest(record: "ContentRecord") -> str:
+    """SHA-256 of a content source, reused from the manifest while its size and mtime hold."""
+    return file_digest(record.path, record.stat)
+
+
+def file_digest(path: Path, stat: tuple[int, int] | None = None) -> str:
+    """SHA-256 of a source file, reused from the manifest while its size and mtime hold."""
+    key = path.relative_to(ROOT).as_posix()
+    if stat is None:
+        st = path.stat()
+        stat = (st.st_mtime_ns, st.st_size)
+    stat = list(stat)
+    cached = _manifest["sources"].get(key)
+    if cached and cached[:2] == stat:
+        digest = cached[2]
+    else:
+        digest = file_sha256(path)
+    _sources[key] = stat + [digest]
+    return digest
+
+
+def needs_build(output: Path, *inputs) -> bool:
+    """Record the inputs of an output file and report whether it must be rebuilt."""
+    key = output.relative_to(OUTPUT).as_posix()
+    fingerprint = hash_inputs(*inputs)
+    _outputs[key] = fingerprint
+    if not INCREMENTAL:
+        return True
+    return _manifest["outputs"].get(key) != fingerprint or not output.exists()
+
+
+def remove_stale_outputs() -> int:
+    """Delete pages built previously whose source no longer exists."""
+    removed = 0
+    for key in sorted(_previous_outputs):
+        if key in _outputs:
+            continue
+        stale = OUTPUT / key
+        if stale.exists():
+            stale.unlink()
+            removed += 1
+        parent = stale.parent
+        while parent != OUTPUT and parent.exists() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+    return removed
+
+
+def unchanged_note(count: int) -> str:
+    """Suffix for build summaries listing pages skipped as unchanged."""
+    return f" ({count} unchanged)" if count else ""
+
+
+class Template(NamedTuple):
+    """A template split into literal text (even indices) and slot names (odd indices)."""
+    name: str
+    digest: str
+    parts: tuple[str, ...]
+
+
+def compile_template(name: str, source: str) -> Template:
+    """Parse template source once into literal and slot segments."""
+    return Template(name, hash_inputs(source), tuple(PLACEHOLDER.split(source)))
+
+
+@functools.lru_cache(maxsize=None)
+def read_template(name: str) -> Template:
+    """Read and compile an HTML template, cached by name."""
+    return compile_template(name, (TEMPLATES / name).read_text(encoding="utf-8"))
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -74,8 +364,32 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     if len(parts) < 3:
         return {}, content
     
+    return parse_meta(parts[1]), parts[2].strip()
+
+
+def read_frontmatter(path: Path) -> dict:
+    """Read only the frontmatter block of a markdown file, leaving the body on disk."""
+    with path.open(encoding="utf-8") as f:
+        head = f.readline()
+        if not head.startswith("---"):
+            return {}
+        while (end := head.find("---", 3)) < 0:
+            line = f.readline()
+            if not line:
+                return {}
+            head += line
+    return parse_meta(head[3:end])
+
+
+def load_body(path: Path) -> str:
+    """Read the markdown body of a source file."""
+    return parse_frontmatter(path.read_text(encoding="utf-8"))[1]
+
+
+def parse_meta(block: str) -> dict:
+    """Parse the key: value lines of a frontmatter block."""
     frontmatter = {}
-    for line in parts[1].strip().split("\n"):
+    for line in block.strip().split("\n"):
         # Split on ': ' to handle keys with colons like 'og:image'
         if ": " in line:
             idx = line.index(": ")
@@ -88,97 +402,608 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
             value = value.strip().strip('"').strip("'")
             frontmatter[key.strip()] = value
     
-    return frontmatter, parts[2].strip()
+    return frontmatter
+
+
+class ContentRecord:
+    """One markdown source: its location and the metadata every builder needs."""
+    
+    __slots__ = ("section", "slug", "path", "stat", "meta", "title", "url", "date", "date_str")
+    
+    def __init__(self, section: str, path: Path, stat: tuple[int, int], meta: dict):
+        self.section = section
+        self.slug = path.stem
+        self.path = path
+        self.stat = stat
+        self.meta = meta
+        self.title = meta.get("title", self.slug.replace("-", " ").title())
+        self.url = f"/{section}/{self.slug}"
+        self.date = None
+        self.date_str = ""
+        
+        # Ge'ez pages are undated and keep discovery order
+        if section == "geez":
+            return
+        
+        date_str = meta.get("date", "")
+        if not date_str:
+            # Undated posts sort as 2025-01-01; undated works as today
+            date_str = "2025-01-01" if section == "blog" else datetime.now().strftime("%Y-%m-%d")
+        
+        try:
+            self.date = datetime.strptime(date_str, "%Y-%m-%d")
+        except ValueError:
+            self.date = datetime.now()
+        self.date_str = self.date.strftime("%Y-%m-%d") if section == "blog" else date_str
+    
+    @property
+    def description(self) -> str:
+        return self.meta.get("description", "")
+    
+    @property
+    def title_transliterated(self) -> str:
+        return self.meta.get("title_transliterated", "")
+    
+    @property
+    def year(self) -> str:
+        return self.date.strftime("%Y")
+    
+    @property
+    def date_iso(self) -> str:
+        return self.date.strftime("%Y-%m-%d")
+    
+    @property
+    def date_formatted(self) -> str:
+        return self.date.strftime("%B %d, %Y")
+    
+    @property
+    def date_humanized(self) -> str:
+        return humanize_date(self.date)
+
+
+def record_sort_key(record: ContentRecord) -> float:
+    """Newest first; undated records keep insertion order."""
+    return -record.date.timestamp() if record.date else 0.0
+
+
+class ContentIndex:
+    """All content records, kept sorted newest first per section and keyed by slug."""
+    
+    __slots__ = ("_sections", "_records")
+    
+    def __init__(self):
+        self._sections = {section: [] for section in CONTENT_SECTIONS}
+        self._records = {}
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def add(self, record: ContentRecord):
+        """Insert or replace a record, keeping its section sorted."""
+        self.remove(record.section, record.slug)
+        bisect.insort(self._sections[record.section], record, key=record_sort_key)
+        self._records[record.section, record.slug] = record
+    
+    def remove(self, section: str, slug: str) -> ContentRecord | None:
+        """Drop a record, returning it if it existed."""
+        record = self._records.pop((section, slug), None)
+        if record is not None:
+            self._sections[section].remove(record)
+        return record
+    
+    def section(self, section: str) -> list[ContentRecord]:
+        """Records of one section, newest first. Callers must not modify the list."""
+        return self._sections[section]
+    
+    def latest(self, count: int, sections: tuple[str, ...] = tuple(CONTENT_SECTIONS)) -> list[ContentRecord]:
+        """The newest dated records across sections, merged without re-sorting."""
+        dated = (
+            (r for r in self._sections[s] if r.date is not None)
+            for s in sections
+        )
+        return list(itertools.islice(heapq.merge(*dated, key=record_sort_key), count))
+    
+    def between(self, section: str, start: datetime, end: datetime) -> list[ContentRecord]:
+        """Records of a dated section with start <= date < end, newest first."""
+        records = self._sections[section]
+        lo = bisect.bisect_right(records, -end.timestamp(), key=record_sort_key)
+        hi = bisect.bisect_right(records, -start.timestamp(), key=record_sort_key)
+        return records[lo:hi]
+
+
+def iter_content():
+    """Yield a record per markdown source across all sections, reading only frontmatter."""
+    for section, root in CONTENT_SECTIONS.items():
+        if not root.exists():
+            continue
+        with os.scandir(root) as it:
+            for item in it:
+                if not item.name.endswith(".md") or item.name == "index.md" or not item.is_file():
+                    continue
+                yield load_record(section, Path(item.path))
+
+
+def load_record(section: str, path: Path) -> ContentRecord:
+    """Build the record for one markdown source from its frontmatter."""
+    stat = path.stat()
+    return ContentRecord(section, path, (stat.st_mtime_ns, stat.st_size), read_frontmatter(path))
+
+
+def discover_content() -> ContentIndex:
+    """Index every content record."""
+    index = ContentIndex()
+    for record in iter_content():
+        index.add(record)
+    return index
+
+
+def create_markdown() -> markdown.Markdown:
+    """Create a Markdown converter with the site's extensions."""
+    return markdown.Markdown(
+        extensions=MARKDOWN_EXTENSIONS,
+        extension_configs=MARKDOWN_EXTENSION_CONFIGS,
+    )
+
+
+def get_markdown() -> markdown.Markdown:
+    """Return this thread's Markdown converter, reset for a new document."""
+    md = getattr(_converters, "md", None)
+    if md is None:
+        md = _converters.md = create_markdown()
+    return md.reset()
+
+
+@functools.lru_cache(maxsize=None)
+def _lexer_for(name: str, options: tuple) -> object:
+    """Cached lexer lookup keyed by language name and sorted options."""
+    return get_lexer_by_name(name, **dict(options))
+
+
+def get_cached_lexer(name: str, **options):
+    """Drop-in for Pygments' get_lexer_by_name that reuses lexers per language."""
+    try:
+        return _lexer_for(name, tuple(sorted(options.items())))
+    except TypeError:  # unhashable option value
+        return get_lexer_by_name(name, **options)
+
+
+# CodeHilite looks the lexer up again for every fenced block
+codehilite.get_lexer_by_name = get_cached_lexer
 
 
 def render_markdown(content: str) -> str:
     """Convert markdown to HTML."""
-    md = markdown.Markdown(
-        extensions=[
-            CodeHiliteExtension(css_class='highlight', linenums=False),
-            FencedCodeExtension(),
-            TableExtension(),
-            TocExtension(permalink=False),
-            'smarty',
-        ]
+    return get_markdown().convert(content)
+
+
+@functools.cache
+def markdown_signature() -> str:
+    """Fingerprint of everything besides the source that shapes rendered HTML."""
+    return hash_inputs(
+        markdown.__version__,
+        pygments.__version__,
+        MARKDOWN_EXTENSIONS,
+        MARKDOWN_EXTENSION_CONFIGS,
     )
-    return md.convert(content)
 
 
-def render_template(template: str, **kwargs) -> str:
-    """Simple template rendering with {{variable}} syntax."""
-    result = template
-    for key, value in kwargs.items():
-        result = result.replace("{{" + key + "}}", str(value) if value else "")
-    # Remove any remaining template variables
-    result = re.sub(r'\{\{[^}]+\}\}', '', result)
-    return result
+def render_cache_path(content: str) -> Path:
+    """Location of the cached HTML for a markdown document."""
+    key = hash_inputs(markdown_signature(), content)
+    return RENDER_CACHE / key[:2] / f"{key}.html"
+
+
+def read_render_cache(content: str) -> str | None:
+    """Return cached HTML for content, marking the entry as recently used."""
+    path = render_cache_path(content)
+    try:
+        html = path.read_text(encoding="utf-8")
+    except OSError:
+        return None
+    os.utime(path)
+    return html
+
+
+def write_render_cache(content: str, html: str):
+    """Store rendered HTML for content."""
+    path = render_cache_path(content)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(html, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def prune_render_cache(limit: int = RENDER_CACHE_LIMIT) -> int:
+    """Evict least recently used entries until the cache fits in limit bytes."""
+    if not RENDER_CACHE.exists():
+        return 0
+    entries = []
+    total = 0
+    for path in RENDER_CACHE.glob("*/*.html"):
+        stat = path.stat()
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+    
+    evicted = 0
+    entries.sort()
+    for _, size, path in entries:
+        if total <= limit:
+            break
+        path.unlink()
+        total -= size
+        evicted += 1
+    return evicted
+
+
+def render_markdown_many(contents: list[str]) -> list[str]:
+    """Convert markdown documents across JOBS processes, keeping input order.
+    
+    Documents found in the rendered-HTML cache skip Markdown and Pygments.
+    """
+    results = [read_render_cache(c) if USE_RENDER_CACHE else None for c in contents]
+    misses = [i for i, html in enumerate(results) if html is None]
+    todo = [contents[i] for i in misses]
+    
+    if JOBS <= 1 or len(todo) < 2:
+        rendered = [render_markdown(content) for content in todo]
+    else:
+        chunksize = max(1, len(todo) // (JOBS * 4))
+        rendered = list(worker_pool().map(render_markdown, todo, chunksize=chunksize))
+    
+    for i, html in zip(misses, rendered):
+        results[i] = html
+        if USE_RENDER_CACHE:
+            write_render_cache(contents[i], html)
+    return results
+
+
+def worker_pool() -> ProcessPoolExecutor:
+    """The shared JOBS-process pool for rendering, font subsetting and image resizing."""
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=JOBS)
+    return _pool
+
+
+def shutdown_render_pool():
+    """Stop the render workers, if any were started."""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
+
+
+def write_pages(template: Template, pending: list[tuple[Path, Path, dict]], image_sizes: str = "") -> int:
+    """Render pending (output, source, fields) pages and write them in order.
+    
+    Bodies are read lazily, one batch at a time, to bound peak memory. With
+    image_sizes, known misloch images get srcset, sizes and intrinsic dimensions.
+    """
+    for start in range(0, len(pending), RENDER_BATCH):
+        batch = pending[start:start + RENDER_BATCH]
+        bodies = [load_body(source) for _, source, _ in batch]
+        if _profiler:
+            # Render one page at a time so markdown time is attributed per page
+            rendered = []
+            for (output, _, _), body in zip(batch, bodies):
+                with profile_phase("markdown", output):
+                    rendered.extend(render_markdown_many([body]))
+        else:
+            rendered = render_markdown_many(bodies)
+        for (output, _, fields), content_html in zip(batch, rendered):
+            if image_sizes:
+                content_html = responsive_images(content_html, image_sizes)
+            html = render_template(template, content=content_html, **fields)
+            write_page(output, html)
+    return len(pending)
+
+
+def write_page(output: Path, text: str):
+    """Write a generated file, creating its directory; HTML is checked against its budget."""
+    with profile_phase("write", output):
+        if output.suffix == ".html":
+            _glyphs.update(text)
+            if CRITICAL_CSS:
+                text = inline_critical_css(text)
+            if MINIFY:
+                text = minify_html(text)
+        data = text.encode("utf-8")
+        write_output(output, data)
+        if output.suffix == ".html":
+            check_budget(output, len(data))
+
+
+def output_current(output: Path, key: str, size: int, digest: str) -> bool:
+    """Whether output already holds bytes of this size and digest.
+    
+    The recorded digest is trusted while the file's size and mtime match it;
+    otherwise the file is hashed.
+    """
+    try:
+        st = output.stat()
+    except FileNotFoundError:
+        return False
+    if st.st_size != size:
+        return False
+    known = _digests.get(key) or _manifest["digests"].get(key)
+    if known and known[:2] == [st.st_size, st.st_mtime_ns]:
+        same = known[2] == digest
+    else:
+        same = file_sha256(output) == digest
+    if same:
+        _digests[key] = [st.st_size, st.st_mtime_ns, digest]
+    return same
+
+
+def commit_output(tmp: Path, output: Path, key: str, digest: str):
+    os.replace(tmp, output)
+    st = output.stat()
+    _digests[key] = [st.st_size, st.st_mtime_ns, digest]
+
+
+def write_output(output: Path, data: bytes) -> bool:
+    """Write data to a file in dist/ through a temporary file, unless it already holds these bytes."""
+    key = output.relative_to(OUTPUT).as_posix()
+    _produced.add(key)
+    digest = hashlib.sha256(data).hexdigest()
+    if output_current(output, key, len(data), digest):
+        return False
+    output.parent.mkdir(parents=True, exist_ok=True)
+    tmp = output.with_name(f".{output.name}.tmp")
+    tmp.write_bytes(data)
+    commit_output(tmp, output, key, digest)
+    return True
+
+
+def replace_output(tmp: Path, output: Path) -> bool:
+    """Move a completely written temporary file over output, unless output already holds its bytes."""
+    key = output.relative_to(OUTPUT).as_posix()
+    _produced.add(key)
+    digest = file_sha256(tmp)
+    if output_current(output, key, tmp.stat().st_size, digest):
+        tmp.unlink()
+        return False
+    commit_output(tmp, output, key, digest)
+    return True
+
+
+def output_delta(old: dict[str, str], new: dict[str, str]) -> dict:
+    """Files added, changed and removed between two {path: sha256} maps of dist/."""
+    return {
+        "added": {key: digest for key, digest in new.items() if key not in old},
+        "changed": {key: digest for key, digest in new.items() if key in old and old[key] != digest},
+        "removed": sorted(key for key in old if key not in new),
+    }
+
 
+def save_deploy_delta():
+    """Write what this build added, changed and removed in dist/ since the previous one."""
+    previous = {key: record[2] for key, record in _manifest["digests"].items()}
+    current = {key: record[2] for key, record in _digests.items()}
+    delta = output_delta(previous, current)
+    CACHE.mkdir(exist_ok=True)
+    DEPLOY_DELTA.write_text(json.dumps(delta, indent=1, sort_keys=True), encoding="utf-8")
+    changes = len(delta["added"]) + len(delta["changed"]) + len(delta["removed"])
+    if changes:
+        print(
+            f"✓ Deploy delta: {len(delta['added'])} added, {len(delta['changed'])} changed, "
+            f"{len(delta['removed'])} removed"
+        )
+
+
+def remove_unproduced_outputs() -> int:
+    """After a full build, delete the files in dist/ it did not produce, and emptied directories."""
+    removed = 0
+    for path in sorted(OUTPUT.rglob("*"), reverse=True):  # children before their directory
+        if path.is_dir():
+            if not any(path.iterdir()):
+                path.rmdir()
+            continue
+        key = path.relative_to(OUTPUT).as_posix()
+        if key in _produced:
+            continue
+        if COMPRESS and compressed_sibling(path) and key[:-len(path.suffix)] in _produced:
+            continue  # precompressed sibling, kept current by compress_outputs()
+        path.unlink()
+        removed += 1
+    return removed
+
+
+def record_digests():
+    """Record [size, mtime_ns, sha256] for every file in dist/, hashing only files whose stat changed."""
+    digests = {}
+    for path in OUTPUT.rglob("*"):
+        if not path.is_file():
+            continue
+        key = path.relative_to(OUTPUT).as_posix()
+        st = path.stat()
+        stat = [st.st_size, st.st_mtime_ns]
+        known = _digests.get(key) or _manifest["digests"].get(key)
+        digests[key] = stat + [known[2] if known and known[:2] == stat else file_sha256(path)]
+    _digests.clear()
+    _digests.update(digests)
 
-def get_blog_posts() -> list[dict]:
-    """Get all blog posts sorted by date."""
-    posts = []
+
+def minify_html(html: str) -> str:
+    """Drop comments and collapse whitespace outside preformatted, script and style elements."""
+    parts = HTML_PRESERVE.split(html)
+    # split() yields text, element, tag name, text, ...
+    for i in range(0, len(parts), 3):
+        parts[i] = WHITESPACE.sub(" ", HTML_COMMENT.sub("", parts[i]))
+    for i in range(1, len(parts), 3):
+        open_end = parts[i].index(">") + 1
+        close = parts[i].rindex("</")
+        body = parts[i][open_end:close]
+        if parts[i + 1].lower() == "style":
+            body = minify_css(body)
+        elif "application/ld+json" in parts[i][:open_end]:
+            try:
+                body = json.dumps(json.loads(body), ensure_ascii=False, separators=(",", ":"))
+            except ValueError:
+                pass  # leave structured data that does not parse as written
+        parts[i] = parts[i][:open_end] + body + parts[i][close:]
+        parts[i + 1] = ""
+    return "".join(parts).strip()
+
+
+def minify_css(css: str) -> str:
+    """Drop comments and redundant whitespace from a stylesheet."""
+    parts = CSS_STRING.split(CSS_COMMENT.sub("", css))
+    for i in range(0, len(parts), 2):
+        part = WHITESPACE.sub(" ", parts[i])
+        part = CSS_PUNCTUATION.sub(r"\1", part)
+        parts[i] = re.sub(r':\s+', ':', part).replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def parse_css(css: str) -> list[tuple[str, object]]:
+    """Split a stylesheet into (prelude, declarations) rules.
+    
+    @media and @supports blocks hold a list of nested rules; other block
+    at-rules (@font-face, @keyframes) are skipped.
+    """
+    css = minify_css(css)
+    
+    def block(pos: int) -> tuple[list, int]:
+        rules = []
+        while pos < len(css):
+            if css[pos] == "}":
+                return rules, pos + 1
+            start = css.find("{", pos)
+            if start < 0:
+                break
+            prelude = css[pos:start].rsplit(";", 1)[-1].strip()  # drop @charset-style statements
+            if prelude.startswith(("@media", "@supports")):
+                inner, pos = block(start + 1)
+                rules.append((prelude, inner))
+                continue
+            depth, end = 1, start + 1
+            while depth and end < len(css):
+                depth += {"{": 1, "}": -1}.get(css[end], 0)
+                end += 1
+            if not prelude.startswith("@"):
+                rules.append((prelude, css[start + 1:end - 1]))
+            pos = end
+        return rules, pos
+    
+    return block(0)[0]
+
+
+@functools.lru_cache(maxsize=None)
+def stylesheet_rules(name: str, digest: str) -> tuple[list, frozenset]:
+    """Parsed rules of a stylesheet in src/css, and every class, id and tag its selectors name."""
+    rules = parse_css((CSS / name).read_text(encoding="utf-8"))
+    names = set()
+    
+    def collect(rules):
+        for prelude, body in rules:
+            if isinstance(body, list):
+                collect(body)
+            else:
+                names.update(prefix + token for prefix, token in SELECTOR_TOKEN.findall(SELECTOR_IGNORED.sub(" ", prelude)))
     
-    for md_file in BLOG.glob("*.md"):
-        if md_file.name == "index.md":
+    collect(rules)
+    return rules, frozenset(names)
+
+
+def selector_required(selector: str) -> frozenset | None:
+    """Classes, ids and tags an element path needs for selector to match; None for interactive states."""
+    if SELECTOR_INTERACTIVE.search(selector):
+        return None
+    return frozenset(prefix + token.lower() if not prefix else prefix + token
+                     for prefix, token in SELECTOR_TOKEN.findall(SELECTOR_IGNORED.sub(" ", selector)))
+
+
+def select_rules(rules: list, present: frozenset) -> str:
+    """CSS text of the rules with a selector whose names all appear in present."""
+    out = []
+    for prelude, body in rules:
+        if isinstance(body, list):
+            inner = select_rules(body, present)
+            if inner:
+                out.append(f"{prelude}{{{inner}}}")
             continue
-        
-        content = md_file.read_text(encoding="utf-8")
-        meta, body = parse_frontmatter(content)
-        
-        # Extract date
-        date_str = meta.get("date", "")
-        if not date_str:
-            # Try to get from og:image or use file mtime
-            date_str = "2025-01-01"
-        
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            date = datetime.now()
-        
-        slug = md_file.stem
-        
-        posts.append({
-            "title": meta.get("title", slug.replace("-", " ").title()),
-            "description": meta.get("description", ""),
-            "date": date,
-            "date_str": date.strftime("%Y-%m-%d"),
-            "date_formatted": date.strftime("%B %d, %Y"),
-            "year": date.strftime("%Y"),
-            "slug": slug,
-            "url": f"/blog/{slug}",
-            "content": body,
-            "meta": meta,
-        })
-    
-    # Sort by date descending
-    posts.sort(key=lambda x: x["date"], reverse=True)
-    return posts
-
-
-def build_home(posts: list[dict]):
+        selectors = [sel for sel in prelude.split(",") if (required := selector_required(sel)) is not None and required <= present]
+        if selectors:
+            out.append(f"{','.join(selectors)}{{{body}}}")
+    return "".join(out)
+
+
+@functools.lru_cache(maxsize=1024)
+def critical_css(sheets: tuple[tuple[str, str], ...], present: frozenset) -> str:
+    """Rules of the given (name, digest) stylesheets used by markup naming present."""
+    return "".join(select_rules(stylesheet_rules(name, digest)[0], present) for name, digest in sheets)
+
+
+def inline_critical_css(html: str) -> str:
+    """Inline the CSS rules a page's first screen uses and load its stylesheets asynchronously."""
+    links = list(STYLESHEET_LINK.finditer(html))
+    body = html.find("<body")
+    if not links or body < 0:
+        return html
+    
+    fold = html[body:body + CRITICAL_FOLD]
+    present = {tag.lower() for tag in HTML_TAG.findall(fold)} | {"html", "body"}
+    present.update("." + cls for value in HTML_CLASS.findall(fold) for cls in value.split())
+    present.update("#" + value for value in HTML_ID.findall(fold))
+    
+    sheets = []
+    named = set()
+    for link in links:
+        path = CSS / link.group(1)
+        if path.exists():
+            digest = file_digest(path)
+            sheets.append((link.group(1), digest))
+            named |= stylesheet_rules(link.group(1), digest)[1]
+    # Only names some selector uses can change the result; drop the rest so pages share cache entries
+    css = critical_css(tuple(sheets), frozenset(present & (named | {"html", "body"})))
+    
+    parts = [html[:links[0].start()], f"<style>{css}</style>\n    "]
+    pos = links[0].start()
+    for link in links:
+        href = f"/css/{link.group(1)}"
+        parts.append(html[pos:link.start()])
+        parts.append(
+            f'<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'" />'
+            f'<noscript><link rel="stylesheet" href="{href}" /></noscript>'
+        )
+        pos = link.end()
+    parts.append(html[pos:])
+    return "".join(parts)
+
+
+def check_budget(output: Path, size: int):
+    """Record a page written over the byte budget for its section."""
+    rel = output.relative_to(OUTPUT)
+    budget = PAGE_BUDGETS.get(rel.parts[0] if len(rel.parts) > 1 else "", PAGE_BUDGET)
+    if size > budget:
+        _over_budget.append((rel.as_posix(), size, budget))
+
+
+def render_template(template: Template, **kwargs) -> str:
+    """Fill a compiled template's {{variable}} slots; unknown slots render empty."""
+    with profile_phase("template"):
+        parts = list(template.parts)
+        for i in range(1, len(parts), 2):
+            value = kwargs.get(parts[i])
+            parts[i] = str(value) if value else ""
+        return "".join(parts)
+
+
+def build_home(posts: list[ContentRecord]):
     """Build the home page."""
     # Read index content
     index_content = (CONTENT / "index.md").read_text(encoding="utf-8")
     meta, body = parse_frontmatter(index_content)
     
     # Build post list HTML
-    post_list_html = '<ul class="post-list">\n'
-    current_year = None
-    for post in posts[:10]:  # Show latest 10 posts
-        year_html = ""
-        if post["year"] != current_year:
-            current_year = post["year"]
-            year_html = f'<span class="year">{current_year}</span>'
-        else:
-            year_html = '<span class="year"></span>'
-        
-        post_list_html += f'''    <li>
-        {year_html}
-        <span class="title"><a href="{post["url"]}">{post["title"]}</a></span>
-    </li>\n'''
-    post_list_html += '</ul>'
+    latest = posts[:HOME_POSTS]
+    post_list_html = post_list(latest, post_items(latest))
+    
+    template = read_template("base.html")
+    output = OUTPUT / "index.html"
+    if not needs_build(output, template.digest, index_content, post_list_html):
+        return
     
     # Build content
     intro_html = render_markdown(body)
@@ -196,7 +1021,6 @@ def build_home(posts: list[dict]):
         </section>
     '''
     
-    template = read_template("base.html")
     html = render_template(
         template,
         title=meta.get("title", "Home"),
@@ -210,84 +1034,143 @@ def build_home(posts: list[dict]):
         content=content_html,
     )
     
-    (OUTPUT / "index.html").write_text(html, encoding="utf-8")
+    write_page(output, html)
     print("✓ Built index.html")
 
 
-def build_blog_index(posts: list[dict]):
-    """Build the blog index page."""
-    post_list_html = '<ul class="post-list">\n'
+def post_items(posts: list[ContentRecord]) -> list[str]:
+    """The title cell of each post, rendered once for every list page that shows it."""
+    return [f'<span class="title"><a href="{post.url}">{post.title}</a></span>' for post in posts]
+
+
+def post_list(posts: list[ContentRecord], items: list[str]) -> str:
+    """Blog list markup; the year shows on the first post of each year on the page."""
+    parts = ['<ul class="post-list">\n']
     current_year = None
-    for post in posts:
-        year_html = ""
-        if post["year"] != current_year:
-            current_year = post["year"]
-            year_html = f'<span class="year">{current_year}</span>'
-        else:
-            year_html = '<span class="year"></span>'
-        
-        post_list_html += f'''    <li>
-        {year_html}
-        <span class="title"><a href="{post["url"]}">{post["title"]}</a></span>
-    </li>\n'''
-    post_list_html += '</ul>'
-    
-    content_html = f'''
+    for post, item in zip(posts, items):
+        year = post.year if post.year != current_year else ""
+        current_year = post.year
+        parts.append(f'''    <li>
+        <span class="year">{year}</span>
+        {item}
+    </li>\n''')
+    parts.append('</ul>')
+    return "".join(parts)
+
+
+def page_url(base: str, number: int) -> str:
+    """URL of page number of a paginated list; page 1 is the list itself."""
+    return base if number == 1 else f"{base}/page/{number}"
+
+
+def page_output(base: str, number: int) -> Path:
+    return OUTPUT / page_url(base, number).lstrip("/") / "index.html"
+
+
+def page_count(total: int) -> int:
+    return max(1, -(-total // PAGE_SIZE))
+
+
+def pagination(base: str, number: int, count: int) -> str:
+    """Newer/older links between the pages of a list, empty for a single page."""
+    if count == 1:
+        return ""
+    parts = ['<nav class="pagination">']
+    if number > 1:
+        parts.append(f'<a href="{page_url(base, number - 1)}" rel="prev">← Newer</a>')
+    parts.append(f'<span>Page {number} of {count}</span>')
+    if number < count:
+        parts.append(f'<a href="{page_url(base, number + 1)}" rel="next">Older →</a>')
+    parts.append('</nav>')
+    return "".join(parts)
+
+
+def build_blog_index(index: ContentIndex):
+    """Build the paginated blog index and an archive per year."""
+    posts = index.section("blog")
+    template = read_template("base.html")
+    items = dict(zip((post.url for post in posts), post_items(posts)))
+    
+    # Each year's posts come from the index's date bisection
+    years = []
+    for year in sorted({post.date.year for post in posts}, reverse=True):
+        years.append((str(year), index.between("blog", datetime(year, 1, 1), datetime(year + 1, 1, 1))))
+    year_links = ""
+    if len(posts) > PAGE_SIZE:
+        links = " ".join(f'<a href="/blog/{year}">{year}</a>' for year, _ in years)
+        year_links = f'<p class="archive-years">{links}</p>'
+    
+    lists = [("/blog", "Blog", posts, year_links)]
+    lists += [(f"/blog/{year}", f"Blog · {year}", records, "") for year, records in years]
+    
+    built = 0
+    for base, heading, records, header_html in lists:
+        count = page_count(len(records))
+        for number in range(1, count + 1):
+            page = records[(number - 1) * PAGE_SIZE:number * PAGE_SIZE]
+            post_list_html = post_list(page, [items[post.url] for post in page]) + pagination(base, number, count)
+            title = heading if number == 1 else f"{heading} · Page {number}"
+            
+            output = page_output(base, number)
+            if not needs_build(output, template.digest, title, header_html, post_list_html):
+                continue
+            
+            content_html = f'''
         <section>
-            <h1 class="section-header">Blog</h1>
-            {post_list_html}
+            <h1 class="section-header">{heading}</h1>
+            {header_html}{post_list_html}
         </section>
     '''
-    
-    template = read_template("base.html")
-    html = render_template(
-        template,
-        title="Blog",
-        description="Technical blog about Rust, Python, machine learning, and software engineering.",
-        keywords="software engineering blog, Rust, Python, machine learning, AI, systems programming, technical blog",
-        og_title="Blog - Esubalew Chekol",
-        og_description="Thoughts on software engineering, machine learning, and computing.",
-        og_image=f"{SITE_URL}/assets/og-blog.png",
-        og_type="website",
-        canonical_url=f"{SITE_URL}/blog",
-        content=content_html,
-    )
-    
-    blog_dir = OUTPUT / "blog"
-    blog_dir.mkdir(exist_ok=True)
-    (blog_dir / "index.html").write_text(html, encoding="utf-8")
-    print("✓ Built blog/index.html")
+            
+            html = render_template(
+                template,
+                title=title,
+                description="Technical blog about Rust, Python, machine learning, and software engineering.",
+                keywords="software engineering blog, Rust, Python, machine learning, AI, systems programming, technical blog",
+                og_title=f"{title} - Esubalew Chekol",
+                og_description="Thoughts on software engineering, machine learning, and computing.",
+                og_image=f"{SITE_URL}/assets/og-blog.png",
+                og_type="website",
+                canonical_url=f"{SITE_URL}{page_url(base, number)}",
+                content=content_html,
+            )
+            
+            write_page(output, html)
+            built += 1
+    
+    if built:
+        print(f"✓ Built {built} blog index pages ({len(years)} years)")
 
 
-def build_blog_posts(posts: list[dict]):
+def build_blog_posts(posts: list[ContentRecord]):
     """Build individual blog post pages."""
     template = read_template("blog-post.html")
     blog_dir = OUTPUT / "blog"
     blog_dir.mkdir(exist_ok=True)
     
+    pending = []
     for post in posts:
-        content_html = render_markdown(post["content"])
+        output = blog_dir / post.slug / "index.html"
+        if not needs_build(output, template.digest, post.meta, source_digest(post), post.date_str):
+            continue
         
-        html = render_template(
-            template,
-            title=post["title"],
-            description=post["description"],
-            keywords=post["meta"].get("keywords", ""),
-            og_title=post["meta"].get("og:title", post["title"]),
-            og_description=post["meta"].get("og:description", post["description"]),
-            og_image=f"{SITE_URL}{post['meta'].get('og:image', '/assets/og-blog.png')}",
+        meta = post.meta
+        fields = dict(
+            title=post.title,
+            description=post.description,
+            keywords=meta.get("keywords", ""),
+            og_title=meta.get("og:title", post.title),
+            og_description=meta.get("og:description", post.description),
+            og_image=f"{SITE_URL}{meta.get('og:image', '/assets/og-blog.png')}",
             og_type="article",
-            canonical_url=f"{SITE_URL}{post['url']}",
-            date=post["date_str"],
-            date_formatted=post["date_formatted"],
-            content=content_html,
+            canonical_url=f"{SITE_URL}{post.url}",
+            date=post.date_str,
+            date_formatted=post.date_formatted,
         )
-        
-        post_dir = blog_dir / post["slug"]
-        post_dir.mkdir(exist_ok=True)
-        (post_dir / "index.html").write_text(html, encoding="utf-8")
+        pending.append((output, post.path, fields))
     
-    print(f"✓ Built {len(posts)} blog posts")
+    built = write_pages(template, pending)
+    print(f"✓ Built {built} blog posts{unchanged_note(len(posts) - built)}")
 
 
 def build_projects():
@@ -295,6 +1178,12 @@ def build_projects():
     content = (CONTENT / "projects.md").read_text(encoding="utf-8")
     meta, body = parse_frontmatter(content)
     
+    template = read_template("base.html")
+    projects_dir = OUTPUT / "projects"
+    output = projects_dir / "index.html"
+    if not needs_build(output, template.digest, content):
+        return
+    
     # Convert markdown to HTML
     body_html = render_markdown(body)
     
@@ -307,7 +1196,6 @@ def build_projects():
         </section>
     '''
     
-    template = read_template("base.html")
     html = render_template(
         template,
         title=meta.get("title", "Projects"),
@@ -321,9 +1209,7 @@ def build_projects():
         content=content_html,
     )
     
-    projects_dir = OUTPUT / "projects"
-    projects_dir.mkdir(exist_ok=True)
-    (projects_dir / "index.html").write_text(html, encoding="utf-8")
+    write_page(output, html)
     print("✓ Built projects/index.html")
 
 
@@ -332,6 +1218,12 @@ def build_resume():
     content = (CONTENT / "resume.md").read_text(encoding="utf-8")
     meta, body = parse_frontmatter(content)
     
+    template = read_template("base.html")
+    resume_dir = OUTPUT / "resume"
+    output = resume_dir / "index.html"
+    if not needs_build(output, template.digest, content):
+        return
+    
     body_html = render_markdown(body)
     
     content_html = f'''
@@ -343,7 +1235,6 @@ def build_resume():
         </section>
     '''
     
-    template = read_template("base.html")
     html = render_template(
         template,
         title=meta.get("title", "Resume"),
@@ -357,9 +1248,7 @@ def build_resume():
         content=content_html,
     )
     
-    resume_dir = OUTPUT / "resume"
-    resume_dir.mkdir(exist_ok=True)
-    (resume_dir / "index.html").write_text(html, encoding="utf-8")
+    write_page(output, html)
     print("✓ Built resume/index.html")
 
 
@@ -368,6 +1257,12 @@ def build_links():
     content = (CONTENT / "links.md").read_text(encoding="utf-8")
     meta, body = parse_frontmatter(content)
     
+    template = read_template("base.html")
+    links_dir = OUTPUT / "links"
+    output = links_dir / "index.html"
+    if not needs_build(output, template.digest, content):
+        return
+    
     body_html = render_markdown(body)
     
     content_html = f'''
@@ -379,7 +1274,6 @@ def build_links():
         </section>
     '''
     
-    template = read_template("base.html")
     html = render_template(
         template,
         title=meta.get("title", "Links"),
@@ -393,148 +1287,82 @@ def build_links():
         content=content_html,
     )
     
-    links_dir = OUTPUT / "links"
-    links_dir.mkdir(exist_ok=True)
-    (links_dir / "index.html").write_text(html, encoding="utf-8")
+    write_page(output, html)
     print("✓ Built links/index.html")
 
 
-def build_wegoch():
+def build_wegoch(records: list[ContentRecord]):
     """Build all weg pages."""
-    wegoch_dir = CONTENT / "wegoch"
-    if not wegoch_dir.exists():
-        return []
+    if not records:
+        return
     
-    works = []
+    pending = []
     template = read_template("work.html")
+    images = section_images("wegoch")
     output_base = OUTPUT / "wegoch"
     output_base.mkdir(exist_ok=True)
     
-    for md_file in wegoch_dir.glob("*.md"):
-        content = md_file.read_text(encoding="utf-8")
-        meta, body = parse_frontmatter(content)
-        
-        # Extract date
-        date_str = meta.get("date", "")
-        if not date_str:
-            date_str = datetime.now().strftime("%Y-%m-%d")
-        
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            date = datetime.now()
-        
-        slug = md_file.stem
-        url = f"/wegoch/{slug}"
-        
-        content_html = render_markdown(body)
+    for record in records:
+        meta = record.meta
+        output = output_base / record.slug / "index.html"
+        if not needs_build(output, template.digest, meta, source_digest(record), record.date_str, images):
+            continue
         
-        html = render_template(
-            template,
-            title=meta.get("title", slug.replace("-", " ").title()),
+        fields = dict(
+            title=record.title,
             description=meta.get("description", ""),
             keywords=meta.get("keywords", ""),
             og_title=meta.get("og_title", meta.get("title", "")),
             og_description=meta.get("og_description", meta.get("description", "")),
             og_image=f"{SITE_URL}{meta.get('og_image', '/assets/og-image.png')}",
             og_type="article",
-            canonical_url=f"{SITE_URL}{url}",
-            date=date_str,
-            date_formatted=date.strftime("%B {0}, %Y").format(date.day),
-            content=content_html,
+            canonical_url=f"{SITE_URL}{record.url}",
+            date=record.date_str,
+            date_formatted=record.date.strftime("%B {0}, %Y").format(record.date.day),
             back_url="/wegoch",
             back_label="Back to Wegoch",
         )
-        
-        work_dir = output_base / slug
-        work_dir.mkdir(exist_ok=True)
-        (work_dir / "index.html").write_text(html, encoding="utf-8")
-        
-        works.append({
-            "title": meta.get("title", slug.replace("-", " ").title()),
-            "url": url,
-            "slug": slug,
-            "type": "weg",
-            "date": date,
-            "date_formatted": date.strftime("%B %d, %Y"),
-            "date_humanized": humanize_date(date),
-        })
-    
-    # Sort by date descending
-    works.sort(key=lambda x: x["date"], reverse=True)
+        pending.append((output, record.path, fields))
     
-    if works:
-        print(f"✓ Built {len(works)} weg pages")
-    return works
+    built = write_pages(template, pending, IMAGE_SIZES["work"])
+    print(f"✓ Built {built} weg pages{unchanged_note(len(records) - built)}")
 
 
-def build_getem():
+def build_getem(records: list[ContentRecord]):
     """Build all poem pages."""
-    getem_dir = CONTENT / "getem"
-    if not getem_dir.exists():
-        return []
+    if not records:
+        return
     
-    works = []
+    pending = []
     template = read_template("work.html")
+    images = section_images("getem")
     output_base = OUTPUT / "getem"
     output_base.mkdir(exist_ok=True)
     
-    for md_file in getem_dir.glob("*.md"):
-        content = md_file.read_text(encoding="utf-8")
-        meta, body = parse_frontmatter(content)
-        
-        # Extract date
-        date_str = meta.get("date", "")
-        if not date_str:
-            date_str = datetime.now().strftime("%Y-%m-%d")
-        
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            date = datetime.now()
-        
-        slug = md_file.stem
-        url = f"/getem/{slug}"
-        
-        content_html = render_markdown(body)
+    for record in records:
+        meta = record.meta
+        output = output_base / record.slug / "index.html"
+        if not needs_build(output, template.digest, meta, source_digest(record), record.date_str, images):
+            continue
         
-        html = render_template(
-            template,
-            title=meta.get("title", slug.replace("-", " ").title()),
+        fields = dict(
+            title=record.title,
             description=meta.get("description", ""),
             keywords=meta.get("keywords", ""),
             og_title=meta.get("og_title", meta.get("title", "")),
             og_description=meta.get("og_description", meta.get("description", "")),
             og_image=f"{SITE_URL}{meta.get('og_image', '/assets/og-image.png')}",
             og_type="article",
-            canonical_url=f"{SITE_URL}{url}",
-            date=date_str,
-            date_formatted=date.strftime("%B {0}, %Y").format(date.day),
-            content=content_html,
+            canonical_url=f"{SITE_URL}{record.url}",
+            date=record.date_str,
+            date_formatted=record.date.strftime("%B {0}, %Y").format(record.date.day),
             back_url="/getem",
             back_label="Back to Getem",
         )
-        
-        work_dir = output_base / slug
-        work_dir.mkdir(exist_ok=True)
-        (work_dir / "index.html").write_text(html, encoding="utf-8")
-        
-        works.append({
-            "title": meta.get("title", slug.replace("-", " ").title()),
-            "url": url,
-            "slug": slug,
-            "type": "poem",
-            "date": date,
-            "date_formatted": date.strftime("%B %d, %Y"),
-            "date_humanized": humanize_date(date),
-        })
+        pending.append((output, record.path, fields))
     
-    # Sort by date descending
-    works.sort(key=lambda x: x["date"], reverse=True)
-    
-    if works:
-        print(f"✓ Built {len(works)} poem pages")
-    return works
+    built = write_pages(template, pending, IMAGE_SIZES["work"])
+    print(f"✓ Built {built} poem pages{unchanged_note(len(records) - built)}")
 
 
 def parse_geez_content(content: str) -> dict:
@@ -574,26 +1402,26 @@ def parse_geez_content(content: str) -> dict:
     return result
 
 
-def build_geez():
+def build_geez(records: list[ContentRecord]):
     """Build all Ge'ez qine pages (hidden SEO pages)."""
-    geez_dir = CONTENT / "geez"
-    if not geez_dir.exists():
-        return []
+    if not records:
+        return
     
-    works = []
+    built = 0
     template = read_template("geez.html")
+    images = section_images("geez")
     output_base = OUTPUT / "geez"
     output_base.mkdir(exist_ok=True)
     
-    for md_file in geez_dir.glob("*.md"):
-        content = md_file.read_text(encoding="utf-8")
-        meta, body = parse_frontmatter(content)
+    for record in records:
+        meta = record.meta
+        work_dir = output_base / record.slug
+        output = work_dir / "index.html"
+        if not needs_build(output, template.digest, meta, source_digest(record), images):
+            continue
         
         # Parse the special Ge'ez content format
-        geez_content = parse_geez_content(body)
-        
-        slug = md_file.stem
-        url = f"/geez/{slug}"
+        geez_content = parse_geez_content(load_body(record.path))
         
         # Format Ge'ez text with line breaks
         geez_text_html = ""
@@ -636,21 +1464,26 @@ def build_geez():
         if image_src:
             alt = meta.get("image_alt") or meta.get("title", "Ge'ez")
             alt_escaped = html_lib.escape(str(alt), quote=True)
+            img = responsive_img(
+                f'<img src="{image_src}" alt="{alt_escaped}" loading="lazy" decoding="async" />',
+                image_src,
+                IMAGE_SIZES["geez"],
+            )
             image_section = f'''
           <figure class="geez-image">
-            <img src="{image_src}" alt="{alt_escaped}" loading="lazy" decoding="async" />
+            {img}
           </figure>'''
         
         html = render_template(
             template,
-            title=meta.get("title", slug.replace("-", " ").title()),
-            title_transliterated=meta.get("title_transliterated", ""),
+            title=record.title,
+            title_transliterated=record.title_transliterated,
             description=meta.get("description", ""),
             keywords=meta.get("keywords", ""),
             og_title=meta.get("og:title", meta.get("title", "")),
             og_description=meta.get("og:description", meta.get("description", "")),
             og_image=f"{SITE_URL}{meta.get('og:image', '/assets/og-image.png')}",
-            canonical_url=f"{SITE_URL}{url}",
+            canonical_url=f"{SITE_URL}{record.url}",
             geez_text=geez_text_html,
             image_section=image_section,
             meaning_section=meaning_section,
@@ -658,146 +1491,111 @@ def build_geez():
             memorial_section=memorial_section,
         )
         
-        work_dir = output_base / slug
-        work_dir.mkdir(exist_ok=True)
-        (work_dir / "index.html").write_text(html, encoding="utf-8")
-        
-        works.append({
-            "title": meta.get("title", slug.replace("-", " ").title()),
-            "title_transliterated": meta.get("title_transliterated", ""),
-            "url": url,
-            "slug": slug,
-            "type": "geez",
-        })
+        write_page(output, html)
+        built += 1
     
-    if works:
-        print(f"✓ Built {len(works)} Ge'ez pages")
-    return works
+    print(f"✓ Built {built} Ge'ez pages{unchanged_note(len(records) - built)}")
 
 
-def build_cs():
+def build_cs(records: list[ContentRecord]):
     """Build all CS (Computer Science) articles."""
-    cs_dir = CONTENT / "cs"
-    if not cs_dir.exists():
-        return []
+    if not records:
+        return
     
-    articles = []
+    pending = []
     template = read_template("cs.html")
     output_base = OUTPUT / "cs"
     output_base.mkdir(exist_ok=True)
     
-    for md_file in cs_dir.glob("*.md"):
-        content = md_file.read_text(encoding="utf-8")
-        meta, body = parse_frontmatter(content)
-        
-        # Extract date
-        date_str = meta.get("date", "")
-        if not date_str:
-            date_str = datetime.now().strftime("%Y-%m-%d")
-        
-        try:
-            date = datetime.strptime(date_str, "%Y-%m-%d")
-        except ValueError:
-            date = datetime.now()
-        
-        slug = md_file.stem
-        url = f"/cs/{slug}"
+    for record in records:
+        meta = record.meta
+        output = output_base / record.slug / "index.html"
+        if not needs_build(output, template.digest, meta, source_digest(record), record.date_str):
+            continue
         
         # For CS articles, render markdown (which preserves HTML blocks)
-        content_html = render_markdown(body)
-        
-        html = render_template(
-            template,
-            title=meta.get("title", slug.replace("-", " ").title()),
+        fields = dict(
+            title=record.title,
             description=meta.get("description", ""),
             keywords=meta.get("keywords", ""),
             og_title=meta.get("og_title", meta.get("title", "")),
             og_description=meta.get("og_description", meta.get("description", "")),
             og_image=f"{SITE_URL}{meta.get('og_image', '/assets/og-image.png')}",
-            canonical_url=f"{SITE_URL}{url}",
-            date=date_str,
-            date_formatted=date.strftime("%B {0}, %Y").format(date.day),
-            content=content_html,
+            canonical_url=f"{SITE_URL}{record.url}",
+            date=record.date_str,
+            date_formatted=record.date.strftime("%B {0}, %Y").format(record.date.day),
         )
-        
-        article_dir = output_base / slug
-        article_dir.mkdir(exist_ok=True)
-        (article_dir / "index.html").write_text(html, encoding="utf-8")
-        
-        articles.append({
-            "title": meta.get("title", slug.replace("-", " ").title()),
-            "url": url,
-            "slug": slug,
-            "date": date,
-            "date_formatted": date.strftime("%B %d, %Y"),
-            "date_humanized": humanize_date(date),
-            "description": meta.get("description", ""),
-            "type": "cs",
-        })
-    
-    # Sort by date descending
-    articles.sort(key=lambda x: x["date"], reverse=True)
-    
-    if articles:
-        print(f"✓ Built {len(articles)} CS articles")
-    return articles
-
-
-def build_works_index(works: list[dict], section: str, config: dict):
+        pending.append((output, record.path, fields))
+    
+    built = write_pages(template, pending)
+    print(f"✓ Built {built} CS articles{unchanged_note(len(records) - built)}")
+
+
+def build_works_index(works: list[ContentRecord], section: str, config: dict):
     """Build index page for a works section (geez, getem, wegoch)."""
     if not works:
         return
     
     template = read_template("works-index.html")
-    output_dir = OUTPUT / section
-    output_dir.mkdir(exist_ok=True)
     
     # Check if this section should show dates
     show_dates = config.get("show_dates", False)
     
-    # Build the list HTML
-    list_html = '<ul class="works-list">\n'
+    # Render each entry once; pages are slices of the rendered list
+    items = []
     for work in works:
-        title = work.get("title", work["slug"])
-        transliterated = work.get("title_transliterated", "")
+        title = work.title
+        transliterated = work.title_transliterated
         trans_html = f'<span class="work-transliterated">{transliterated}</span>' if transliterated else ""
         
         # Date display for sections that support it
         date_html = ""
-        if show_dates and work.get("date"):
-            date_formatted = work.get("date_formatted", "")
-            date_humanized = work.get("date_humanized", "")
+        if show_dates and work.date:
             date_html = f'''
       <span class="work-date">
-        <time datetime="{work["date"].strftime("%Y-%m-%d")}" title="{date_formatted}">{date_humanized}</time>
+        <time datetime="{work.date_iso}" title="{work.date_formatted}">{work.date_humanized}</time>
       </span>'''
         
-        list_html += f'''  <li>
-    <a href="{work["url"]}">
+        items.append(f'''  <li>
+    <a href="{work.url}">
       <span class="work-title">{title}</span>
       {trans_html}{date_html}
     </a>
-  </li>\n'''
-    list_html += '</ul>\n'
-    list_html += f'<p class="works-count">{len(works)} {config["count_label"]}</p>'
-    
-    html = render_template(
-        template,
-        lang=config.get("lang", "am"),
-        title=config["title"],
-        title_ethiopic=config["title_ethiopic"],
-        subtitle=config["subtitle"],
-        description=config["description"],
-        keywords=config["keywords"],
-        og_title=config["og_title"],
-        og_description=config["og_description"],
-        og_image=f"{SITE_URL}/assets/og-{section}.png",
-        canonical_url=f"{SITE_URL}/{section}",
-        content=list_html,
-    )
+  </li>\n''')
+    count_html = f'<p class="works-count">{len(works)} {config["count_label"]}</p>'
+    
+    base = f"/{section}"
+    count = page_count(len(works))
+    built = 0
+    for number in range(1, count + 1):
+        page_items = items[(number - 1) * PAGE_SIZE:number * PAGE_SIZE]
+        list_html = "".join(['<ul class="works-list">\n', *page_items, '</ul>\n', count_html, pagination(base, number, count)])
+        title = config["title"] if number == 1 else f"{config['title']} · Page {number}"
+        
+        output = page_output(base, number)
+        if not needs_build(output, template.digest, section, config, title, list_html):
+            continue
+        
+        html = render_template(
+            template,
+            lang=config.get("lang", "am"),
+            title=title,
+            title_ethiopic=config["title_ethiopic"],
+            subtitle=config["subtitle"],
+            description=config["description"],
+            keywords=config["keywords"],
+            og_title=config["og_title"],
+            og_description=config["og_description"],
+            og_image=f"{SITE_URL}/assets/og-{section}.png",
+            canonical_url=f"{SITE_URL}{page_url(base, number)}",
+            content=list_html,
+        )
+        
+        write_page(output, html)
+        built += 1
     
-    (output_dir / "index.html").write_text(html, encoding="utf-8")
-    print(f"✓ Built {section}/index.html")
+    if built:
+        print(f"✓ Built {section}/index.html" + (f" ({count} pages)" if count > 1 else ""))
 
 
 def build_404():
@@ -811,6 +1609,10 @@ def build_404():
     '''
     
     template = read_template("base.html")
+    output = OUTPUT / "404.html"
+    if not needs_build(output, template.digest, content_html):
+        return
+    
     html = render_template(
         template,
         title="404 - Page Not Found",
@@ -824,127 +1626,946 @@ def build_404():
         content=content_html,
     )
     
-    (OUTPUT / "404.html").write_text(html, encoding="utf-8")
+    write_page(output, html)
     print("✓ Built 404.html")
 
 
+class SyncStats:
+    """Counters for one static sync pass."""
+    
+    __slots__ = ("copied", "copied_bytes", "linked", "skipped", "skipped_bytes", "removed")
+    
+    def __init__(self):
+        self.copied = self.copied_bytes = self.linked = 0
+        self.skipped = self.skipped_bytes = self.removed = 0
+    
+    def summary(self) -> str:
+        return (
+            f"{self.copied} copied ({format_bytes(self.copied_bytes)}), {self.linked} linked, "
+            f"{self.skipped} unchanged ({format_bytes(self.skipped_bytes)} skipped), {self.removed} removed"
+        )
+
+
+def format_bytes(size: float) -> str:
+    """Human-readable byte count."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def file_sha256(path: Path) -> str:
+    """SHA-256 of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def sync_file(src: Path, dst: Path, stats: SyncStats):
+    """Copy or hard-link src to dst unless dst is already current."""
+    _produced.add(dst.relative_to(OUTPUT).as_posix())
+    src_stat = src.stat()
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        dst_stat = None
+    
+    if dst_stat and dst_stat.st_size == src_stat.st_size:
+        same = dst_stat.st_mtime_ns == src_stat.st_mtime_ns or (src_stat.st_ino == dst_stat.st_ino and src_stat.st_dev == dst_stat.st_dev)
+        if not same and SYNC_HASH and file_sha256(src) == file_sha256(dst):
+            os.utime(dst, ns=(src_stat.st_atime_ns, src_stat.st_mtime_ns))
+            same = True
+        if same:
+            stats.skipped += 1
+            stats.skipped_bytes += src_stat.st_size
+            return
+    
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.tmp")
+    if SYNC_LINK:
+        try:
+            tmp.unlink(missing_ok=True)
+            os.link(src, tmp)
+            os.replace(tmp, dst)
+            stats.linked += 1
+            return
+        except OSError:
+            pass  # cross-device or unsupported; fall back to copying
+    shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+    stats.copied += 1
+    stats.copied_bytes += src_stat.st_size
+
+
+def sync_dir(src_dir: Path, dst_dir: Path, stats: SyncStats, pattern: str = "*", recursive: bool = False, exclude: frozenset = frozenset()):
+    """Mirror files matching pattern from src_dir into dst_dir, removing stale matches.
+    
+    Paths in exclude (relative to src_dir) are generated elsewhere: neither copied nor removed.
+    """
+    files = src_dir.rglob(pattern) if recursive else src_dir.glob(pattern)
+    wanted = {Path(p) for p in exclude}
+    for src in files:
+        if src.is_file():
+            rel = src.relative_to(src_dir)
+            if rel in wanted:
+                continue
+            wanted.add(rel)
+            sync_file(src, dst_dir / rel, stats)
+    
+    if not dst_dir.exists():
+        return
+    existing = dst_dir.rglob(pattern) if recursive else dst_dir.glob(pattern)
+    for dst in list(existing):
+        rel = dst.relative_to(dst_dir)
+        if rel.suffix in COMPRESSED_SUFFIXES and rel.with_suffix("") in wanted:
+            continue  # precompressed sibling, kept current by compress_outputs()
+        if dst.is_file() and rel not in wanted:
+            dst.unlink()
+            stats.removed += 1
+
+
+class ImageInfo(NamedTuple):
+    """Intrinsic size of a misloch image and its resized variants per format."""
+    width: int
+    height: int
+    digest: str
+    variants: dict  # format -> ((url, width), ...)
+
+
+@functools.cache
+def _image_module():
+    """PIL.Image, or None when Pillow is missing."""
+    try:
+        from PIL import Image
+    except ImportError:
+        return None
+    return Image
+
+
+def image_formats() -> list[str]:
+    """Variant formats the installed Pillow can encode."""
+    from PIL import features
+    return ["webp"] + (["avif"] if features.check("avif") else [])
+
+
+def image_widths(width: int) -> list[int]:
+    """Variant widths for an image: the ladder below its width, plus full size when small."""
+    widths = [w for w in IMAGE_WIDTHS if w < width]
+    if width <= IMAGE_WIDTHS[-1]:
+        widths.append(width)
+    return widths
+
+
+def image_cache_path(digest: str, width: int, fmt: str) -> Path:
+    """Cache location of one resized variant of an image."""
+    return IMAGE_CACHE / f"{digest[:16]}-{width}.{fmt}"
+
+
+def image_size(path: Path, digest: str) -> tuple[int, int]:
+    """Display width and height of an image, cached per source digest."""
+    cached = IMAGE_CACHE / f"{digest[:16]}.size"
+    try:
+        width, height = map(int, cached.read_text().split())
+        return width, height
+    except (OSError, ValueError):
+        pass
+    Image = _image_module()
+    with Image.open(path) as img:
+        width, height = img.size
+        # Only JPEG orientation is honoured; getexif() on a PNG decodes the whole image
+        if img.format == "JPEG" and img.getexif().get(0x0112, 1) in (5, 6, 7, 8):
+            width, height = height, width  # EXIF rotation swaps the axes
+    IMAGE_CACHE.mkdir(parents=True, exist_ok=True)
+    tmp = cached.with_name(f".{cached.name}.tmp")
+    tmp.write_text(f"{width} {height}\n")
+    os.replace(tmp, cached)
+    return width, height
+
+
+def resize_image(source: str, digest: str, widths: tuple[int, ...], formats: tuple[str, ...]) -> str:
+    """Write every missing resized variant of an image to the image cache.
+    
+    Returns an error message for images Pillow cannot decode, else "".
+    """
+    try:
+        _resize_image(source, digest, widths, formats)
+    except (OSError, SyntaxError, ValueError) as e:
+        return str(e) or type(e).__name__
+    return ""
+
+
+def _resize_image(source: str, digest: str, widths: tuple[int, ...], formats: tuple[str, ...]):
+    Image = _image_module()
+    from PIL import ImageOps
+    with Image.open(source) as img:
+        img = ImageOps.exif_transpose(img)
+        img = img.convert("RGBA" if "A" in img.getbands() or "transparency" in img.info else "RGB")
+        for width in widths:
+            height = max(1, round(img.height * width / img.width))
+            resized = img if width == img.width else img.resize((width, height), Image.LANCZOS)
+            for fmt in formats:
+                target = image_cache_path(digest, width, fmt)
+                if target.exists():
+                    continue
+                tmp = target.with_name(f".{target.name}.tmp")
+                resized.save(tmp, fmt.upper(), quality=IMAGE_QUALITY[fmt])
+                os.replace(tmp, target)
+
+
+def prepare_images():
+    """Resize the misloch images into dist/ and record them for srcset markup.
+    
+    Runs before the pages so builders can emit intrinsic dimensions; variants
+    missing from the cache are encoded across the worker pool.
+    """
+    _images.clear()
+    Image = _image_module()
+    if Image is None:
+        print("Responsive images skipped - install Pillow")
+        return
+    
+    formats = image_formats()
+    todo = []
+    for section in ("wegoch", "getem", "geez"):
+        misloch = CONTENT / section / "misloch"
+        if not misloch.exists():
+            continue
+        for path in sorted(misloch.iterdir()):
+            if path.suffix.lower() not in IMAGE_SUFFIXES:
+                continue
+            digest = file_digest(path)
+            try:
+                width, height = image_size(path, digest)
+            except (OSError, SyntaxError) as e:
+                print(f"⚠️  Skipping image {path.relative_to(ROOT)}: {e}")
+                continue
+            widths = image_widths(width)
+            base = f"/{section}/misloch/{path.stem}"
+            variants = {fmt: tuple((f"{base}-{w}.{fmt}", w) for w in widths) for fmt in formats}
+            _images[f"/{section}/misloch/{path.name}"] = ImageInfo(width, height, digest, variants)
+            if not all(image_cache_path(digest, w, fmt).exists() for w in widths for fmt in formats):
+                todo.append((str(path), digest, tuple(widths), tuple(formats)))
+    
+    if todo:
+        IMAGE_CACHE.mkdir(parents=True, exist_ok=True)
+        if JOBS <= 1 or len(todo) < 2:
+            errors = [resize_image(*job) for job in todo]
+        else:
+            errors = list(worker_pool().map(resize_image, *zip(*todo)))
+        for (source, *_), error in zip(todo, errors):
+            if error:
+                path = Path(source)
+                print(f"⚠️  Skipping image {path.relative_to(ROOT)}: {error}")
+                del _images[f"/{path.parent.parent.name}/misloch/{path.name}"]
+    
+    stats = SyncStats()
+    for info in _images.values():
+        for fmt, variants in info.variants.items():
+            for url, width in variants:
+                sync_file(image_cache_path(info.digest, width, fmt), OUTPUT / url.lstrip("/"), stats)
+    
+    count = sum(len(v) for info in _images.values() for v in info.variants.values())
+    print(f"✓ Prepared {count} image variants ({', '.join(formats)}) for {len(_images)} images{unchanged_note(count - stats.copied)}")
+
+
+def section_images(section: str) -> tuple:
+    """Image records of a section, as a fingerprint input for its pages."""
+    prefix = f"/{section}/"
+    return tuple(sorted((url, info) for url, info in _images.items() if url.startswith(prefix)))
+
+
+def image_variant_names(section: str) -> frozenset:
+    """File names of the generated variants inside a section's misloch directory."""
+    prefix = f"/{section}/misloch/"
+    return frozenset(
+        url[len(prefix):]
+        for key, info in _images.items() if key.startswith(prefix)
+        for variants in info.variants.values()
+        for url, _ in variants
+    )
+
+
+def srcset(variants: tuple) -> str:
+    """srcset value listing (url, width) variants."""
+    return ", ".join(f"{url} {w}w" for url, w in variants)
+
+
+def responsive_img(tag: str, src: str, sizes: str) -> str:
+    """Add srcset, sizes and intrinsic size to an <img> tag, wrapping it in <picture> for AVIF."""
+    info = _images.get(src)
+    if not info:
+        return tag
+    attrs = f' srcset="{srcset(info.variants["webp"])}" sizes="{sizes}" width="{info.width}" height="{info.height}"'
+    if "loading=" not in tag:
+        attrs += ' loading="lazy" decoding="async"'
+    end = -2 if tag.endswith("/>") else -1
+    tag = f"{tag[:end].rstrip()}{attrs} {tag[end:]}"
+    if "avif" not in info.variants:
+        return tag
+    return f'<picture><source type="image/avif" srcset="{srcset(info.variants["avif"])}" sizes="{sizes}">{tag}</picture>'
+
+
+def responsive_images(html: str, sizes: str) -> str:
+    """Give every known misloch <img> in rendered HTML responsive variants."""
+    if not _images or "<img" not in html:
+        return html
+    return IMG_TAG.sub(lambda m: responsive_img(m.group(0), m.group(1), sizes), html)
+
+
 def copy_static():
-    """Copy static assets."""
-    # Copy CSS
-    css_out = OUTPUT / "css"
-    css_out.mkdir(exist_ok=True)
-    for css_file in CSS.glob("*.css"):
-        shutil.copy(css_file, css_out / css_file.name)
-    print("✓ Copied CSS files")
-    
-    # Copy assets (fonts, images, etc.)
-    assets_out = OUTPUT / "assets"
+    """Sync static assets into dist/, copying only new or changed files."""
+    stats = SyncStats()
+    
+    # CSS; fonts.css is written by subset_fonts() when subsetting is available,
+    # and with --minify every other stylesheet is written minified here
+    generated = {FONTS_CSS} if font_subsetter() else set()
+    if MINIFY:
+        for src in sorted(CSS.glob("*.css")):
+            if src.name not in generated:
+                write_output(OUTPUT / "css" / src.name, minify_css(src.read_text(encoding="utf-8")).encode("utf-8"))
+                generated.add(src.name)
+    sync_dir(CSS, OUTPUT / "css", stats, "*.css", exclude=frozenset(generated))
+    
+    # Scripts
+    if JS.exists():
+        sync_dir(JS, OUTPUT / "js", stats, "*.js")
+    
+    # Assets (fonts, images, etc.)
     if ASSETS.exists():
-        shutil.copytree(ASSETS, assets_out, dirs_exist_ok=True)
-        print("✓ Copied assets")
-    
-    # Copy CNAME
-    cname = ROOT / "CNAME"
-    if cname.exists():
-        shutil.copy(cname, OUTPUT / "CNAME")
-        print("✓ Copied CNAME")
-    
-    # Copy robots.txt
-    robots = ROOT / "docs" / "robots.txt"
-    if robots.exists():
-        shutil.copy(robots, OUTPUT / "robots.txt")
-        print("✓ Copied robots.txt")
-    
-    # Copy OG images from blog
-    blog_out = OUTPUT / "blog"
-    blog_out.mkdir(exist_ok=True)
-    for og_file in BLOG.glob("og-*.png"):
-        shutil.copy(og_file, blog_out / og_file.name)
-    for og_file in BLOG.glob("og-*.svg"):
-        shutil.copy(og_file, blog_out / og_file.name)
-    print("✓ Copied blog OG images")
-    
-    # Copy wegoch images (misloch)
-    wegoch_misloch = CONTENT / "wegoch" / "misloch"
-    if wegoch_misloch.exists():
-        wegoch_out = OUTPUT / "wegoch" / "misloch"
-        wegoch_out.mkdir(parents=True, exist_ok=True)
-        for img_file in wegoch_misloch.glob("*"):
-            if img_file.is_file():
-                shutil.copy(img_file, wegoch_out / img_file.name)
-        print("✓ Copied wegoch images")
-    
-    # Copy getem images (misloch)
-    getem_misloch = CONTENT / "getem" / "misloch"
-    if getem_misloch.exists():
-        getem_out = OUTPUT / "getem" / "misloch"
-        getem_out.mkdir(parents=True, exist_ok=True)
-        for img_file in getem_misloch.glob("*"):
-            if img_file.is_file():
-                shutil.copy(img_file, getem_out / img_file.name)
-        print("✓ Copied getem images")
-
-    # Copy Ge'ez images (misloch)
-    geez_misloch = CONTENT / "geez" / "misloch"
-    if geez_misloch.exists():
-        geez_out = OUTPUT / "geez" / "misloch"
-        geez_out.mkdir(parents=True, exist_ok=True)
-        for img_file in geez_misloch.glob("*"):
-            if img_file.is_file():
-                shutil.copy(img_file, geez_out / img_file.name)
-        print("✓ Copied geez images")
-
-
-def generate_sitemap(posts: list[dict], wegs: list[dict], poems: list[dict], geez_pages: list[dict], cs_articles: list[dict]):
-    """Generate sitemap.xml."""
-    urls = [
-        (SITE_URL, "1.0"),
-        (f"{SITE_URL}/projects", "0.8"),
-        (f"{SITE_URL}/blog", "0.9"),
-        (f"{SITE_URL}/resume", "0.7"),
-        (f"{SITE_URL}/links", "0.6"),
-    ]
-    
-    # Add index pages for works sections
-    if wegs:
-        urls.append((f"{SITE_URL}/wegoch", "0.7"))
-    if poems:
-        urls.append((f"{SITE_URL}/getem", "0.7"))
-    if geez_pages:
-        urls.append((f"{SITE_URL}/geez", "0.8"))
-    if cs_articles:
-        urls.append((f"{SITE_URL}/cs", "0.8"))
+        sync_dir(ASSETS, OUTPUT / "assets", stats, recursive=True)
     
-    for post in posts:
-        urls.append((f"{SITE_URL}{post['url']}", "0.6"))
+    # CNAME and robots.txt
+    for src, name in ((ROOT / "CNAME", "CNAME"), (ROOT / "docs" / "robots.txt", "robots.txt")):
+        if src.exists():
+            sync_file(src, OUTPUT / name, stats)
     
-    for weg in wegs:
-        urls.append((f"{SITE_URL}{weg['url']}", "0.6"))
+    # OG images from blog
+    sync_dir(BLOG, OUTPUT / "blog", stats, "og-*.png")
+    sync_dir(BLOG, OUTPUT / "blog", stats, "og-*.svg")
     
-    for poem in poems:
-        urls.append((f"{SITE_URL}{poem['url']}", "0.6"))
+    # Images (misloch) for wegoch, getem and Ge'ez; resized variants come from prepare_images()
+    for section in ("wegoch", "getem", "geez"):
+        misloch = CONTENT / section / "misloch"
+        if misloch.exists():
+            sync_dir(misloch, OUTPUT / section / "misloch", stats, exclude=image_variant_names(section))
     
-    # Ge'ez pages are SEO-focused so give them higher priority
-    for geez in geez_pages:
-        urls.append((f"{SITE_URL}{geez['url']}", "0.8"))
+    print(f"✓ Synced static files: {stats.summary()}")
+
+
+@functools.cache
+def _font_subset_module():
+    """fontTools.subset, or None when fontTools or brotli (for WOFF2) is missing."""
+    try:
+        from fontTools import subset
+        import brotli  # noqa: F401 - WOFF2 compression
+    except ImportError:
+        return None
+    logging.getLogger("fontTools").setLevel(logging.ERROR)
+    return subset
+
+
+def font_subsetter():
+    """The subsetting module when font subsetting is enabled and installed."""
+    return _font_subset_module() if SUBSET_FONTS else None
+
+
+def subset_font(source: str, target: str, codepoints: tuple[int, ...]):
+    """Write a WOFF2 subset of a TrueType font holding only the given codepoints."""
+    subset = _font_subset_module()
+    options = subset.Options()
+    options.flavor = "woff2"
+    options.layout_features = ["*"]
+    font = subset.load_font(source, options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(unicodes=codepoints)
+    subsetter.subset(font)
+    tmp = Path(target).with_name(f".{Path(target).name}.tmp")
+    subset.save_font(font, str(tmp), options)
+    font.close()
+    os.replace(tmp, target)
+
+
+@functools.lru_cache(maxsize=None)
+def font_charset(path: Path, digest: str) -> frozenset:
+    """Codepoints a font maps to glyphs, cached by content digest."""
+    from fontTools.ttLib import TTFont
+    with TTFont(path, lazy=True) as font:
+        return frozenset(font.getBestCmap())
+
+
+def unicode_range(codepoints: list[int], gap: int = 1) -> str:
+    """CSS unicode-range value for sorted codepoints, merging runs at most gap apart."""
+    ranges = []
+    start = prev = codepoints[0]
+    for cp in codepoints[1:] + [None]:
+        if cp is not None and cp - prev <= gap:
+            prev = cp
+            continue
+        ranges.append(f"U+{start:X}" if start == prev else f"U+{start:X}-{prev:X}")
+        if cp is not None:
+            start = prev = cp
+    return ", ".join(ranges)
+
+
+def subset_fonts():
+    """Subset the Ethiopic fonts to the characters used by the built pages.
+    
+    Every @font-face in css/fonts.css that loads a TTF from /assets/ is pointed at a
+    WOFF2 subset in dist/fonts/ with a matching unicode-range, keeping the TTF as a
+    fallback source. The original face is kept ahead of it over the font's whole
+    charset; browsers try the later face first, so the TTF only loads for
+    characters outside the subset, such as ones in search results or content
+    served before a rebuild. Subsets are cached in .cache/fonts/ by font and
+    character set.
+    """
+    fonts_dir = OUTPUT / "fonts"
+    if not font_subsetter():
+        if SUBSET_FONTS:
+            print("Font subsetting skipped - install fonttools and brotli")
+        if fonts_dir.exists():
+            shutil.rmtree(fonts_dir)
+        return
     
-    # CS articles
-    for article in cs_articles:
-        urls.append((f"{SITE_URL}{article['url']}", "0.7"))
+    css = (CSS / FONTS_CSS).read_text(encoding="utf-8")
+    used = SUBSET_ALWAYS.union(ord(c) for c in _glyphs)
+    faces = []  # (rule, font file name, cache path, sorted codepoints, sorted charset)
+    for match in FONT_FACE.finditer(css):
+        rule = match.group(0)
+        src = FONT_SRC.search(rule)
+        font_path = ASSETS / src.group(1) if src else None
+        if not font_path or not font_path.exists():
+            continue
+        digest = file_digest(font_path)
+        charset = font_charset(font_path, digest)
+        codepoints = sorted(used & charset)
+        if not codepoints:
+            continue
+        key = hash_inputs(digest, codepoints)[:12]
+        cached = FONT_CACHE / f"{font_path.stem}-{key}.woff2"
+        faces.append((rule, font_path, cached, codepoints, sorted(charset)))
+    
+    todo = [(str(path), str(cached), tuple(cps)) for _, path, cached, cps, _ in faces if not cached.exists()]
+    if todo:
+        FONT_CACHE.mkdir(parents=True, exist_ok=True)
+        if JOBS <= 1 or len(todo) < 2:
+            for job in todo:
+                subset_font(*job)
+        else:
+            list(worker_pool().map(subset_font, *zip(*todo)))
+    
+    stats = SyncStats()
+    wanted = set()
+    original = subsetted = 0
+    for rule, font_path, cached, codepoints, charset in faces:
+        name = cached.name
+        wanted.add(name)
+        sync_file(cached, fonts_dir / name, stats)
+        original += font_path.stat().st_size
+        subsetted += cached.stat().st_size
+        new_rule = FONT_SRC.sub(
+            lambda m: f"src: url('/fonts/{name}') format('woff2'),\n"
+            f"         url('/assets/{m.group(1)}') format('truetype');",
+            rule,
+        )
+        new_rule = new_rule[:-1].rstrip() + f"\n    unicode-range: {unicode_range(codepoints)};\n}}"
+        fallback = rule[:-1].rstrip() + f"\n    unicode-range: {unicode_range(charset, FONT_FALLBACK_GAP)};\n}}"
+        css = css.replace(rule, f"{fallback}\n\n{new_rule}")
+    
+    if fonts_dir.exists():
+        for stale in fonts_dir.iterdir():
+            if stale.name not in wanted:
+                stale.unlink()
     
-    sitemap = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    sitemap += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+    write_output(OUTPUT / "css" / FONTS_CSS, (minify_css(css) if MINIFY else css).encode("utf-8"))
+    
+    print(
+        f"✓ Subset {len(faces)} fonts to {len(used)} characters: "
+        f"{format_bytes(original)} → {format_bytes(subsetted)}"
+        f"{unchanged_note(len(faces) - len(todo))}"
+    )
+
+
+def compressors() -> dict:
+    """Compression functions by file suffix; brotli only when installed."""
+    algorithms = {".gz": lambda data: gzip.compress(data, 9, mtime=0)}
+    try:
+        import brotli
+        algorithms[".br"] = lambda data: brotli.compress(data, quality=11)
+    except ImportError:
+        pass
+    return algorithms
+
+
+def compress_file(path: Path, suffix: str, compress) -> tuple[int, int, bool]:
+    """Write path's compressed sibling unless it is current.
+    
+    Returns (original size, compressed size, whether it was written).
+    """
+    target = path.with_name(path.name + suffix)
+    stat = path.stat()
+    try:
+        current = target.stat()
+    except FileNotFoundError:
+        current = None
+    if current and current.st_mtime_ns == stat.st_mtime_ns:
+        return stat.st_size, current.st_size, False
+    
+    data = compress(path.read_bytes())
+    tmp = target.with_name(f".{target.name}.tmp")
+    tmp.write_bytes(data)
+    os.utime(tmp, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    os.replace(tmp, target)
+    return stat.st_size, len(data), True
+
+
+def build_output(path: Path) -> bool:
+    """Whether a file in dist/ was produced by this build, or skipped as unchanged by it."""
+    key = path.relative_to(OUTPUT).as_posix()
+    return key in _produced or key in _outputs
+
+
+def compressed_sibling(path: Path) -> bool:
+    """Whether a file in dist/ is a .gz or .br sibling rather than an output the build wrote itself."""
+    # --gzip-sitemaps writes sitemap-N.xml.gz as an output of its own
+    return path.suffix in COMPRESSED_SUFFIXES and not build_output(path)
+
+
+def compress_outputs():
+    """Write .gz and .br siblings for every compressible file in dist/."""
+    algorithms = compressors()
+    sources = []
+    for path in OUTPUT.rglob("*"):
+        if compressed_sibling(path):
+            # Drop siblings of files that no longer exist or are no longer compressed;
+            # files this build did not visit keep theirs
+            source = path.with_suffix("")
+            if not source.exists() or build_output(source) and (
+                source.suffix not in COMPRESSIBLE or source.stat().st_size < COMPRESS_MIN_SIZE or path.suffix not in algorithms
+            ):
+                path.unlink()
+        elif path.suffix in COMPRESSIBLE and build_output(path) and path.stat().st_size >= COMPRESS_MIN_SIZE:
+            # Files left from an earlier build are swept afterwards, not compressed
+            sources.append(path)
+    
+    jobs = [(path, suffix, compress) for path in sources for suffix, compress in algorithms.items()]
+    with ThreadPoolExecutor(max_workers=JOBS) as executor:
+        results = list(executor.map(lambda job: compress_file(*job), jobs))
+    
+    original = sum(path.stat().st_size for path in sources)
+    totals = {suffix: 0 for suffix in algorithms}
+    written = 0
+    for (_, suffix, _), (_, size, wrote) in zip(jobs, results):
+        totals[suffix] += size
+        written += wrote
+    sizes = ", ".join(f"{suffix[1:]} {format_bytes(size)}" for suffix, size in totals.items())
+    print(
+        f"✓ Compressed {len(sources)} files: {format_bytes(original)} → {sizes}"
+        f"{unchanged_note(len(jobs) - written)}"
+    )
+    if ".br" not in algorithms:
+        print("Brotli compression skipped - install brotli")
+
+
+def mtime_date(mtime_ns: int) -> str:
+    return datetime.fromtimestamp(mtime_ns / 1e9).strftime("%Y-%m-%d")
+
+
+def record_lastmod(record: ContentRecord) -> str:
+    """W3C date a record last changed: its lastmod, updated or date frontmatter, else the source mtime."""
+    for key in ("lastmod", "updated", "date"):
+        value = record.meta.get(key, "")[:10]
+        try:
+            return datetime.strptime(value, "%Y-%m-%d").strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return mtime_date(record.stat[0])
+
+
+def sitemap_entries(index: ContentIndex):
+    """Yield (url, priority, lastmod) for every page listed in the sitemap."""
+    sections = {section: [(record, record_lastmod(record)) for record in index.section(section)] for section in CONTENT_SECTIONS}
+    newest = {section: max((lastmod for _, lastmod in entries), default="") for section, entries in sections.items()}
+    
+    def page_lastmod(name: str, *dates: str) -> str:
+        return max((mtime_date((CONTENT / name).stat().st_mtime_ns), *dates))
+    
+    def later_pages(base: str, entries: list, priority: str):
+        # Pages 2+ of a paginated list, each dated by the newest record it lists
+        for number in range(2, page_count(len(entries)) + 1):
+            page = entries[(number - 1) * PAGE_SIZE:number * PAGE_SIZE]
+            yield f"{SITE_URL}{page_url(base, number)}", priority, max(lastmod for _, lastmod in page)
+    
+    yield SITE_URL, "1.0", page_lastmod("index.md", newest["blog"])
+    yield f"{SITE_URL}/projects", "0.8", page_lastmod("projects.md")
+    yield f"{SITE_URL}/blog", "0.9", newest["blog"]
+    yield f"{SITE_URL}/resume", "0.7", page_lastmod("resume.md")
+    yield f"{SITE_URL}/links", "0.6", page_lastmod("links.md")
+    
+    # Index pages for works sections; Ge'ez and CS are weighted higher
+    for section, priority in (("wegoch", "0.7"), ("getem", "0.7"), ("geez", "0.8"), ("cs", "0.8")):
+        if sections[section]:
+            yield f"{SITE_URL}/{section}", priority, newest[section]
+    
+    # Later pages of the paginated blog and works lists
+    yield from later_pages("/blog", sections["blog"], "0.4")
+    for section in WORKS_INDEXES:
+        yield from later_pages(f"/{section}", sections[section], "0.4")
+    
+    # Yearly blog archives, newest post of the year first, with their later pages
+    years = {}
+    for post, lastmod in sections["blog"]:
+        years.setdefault(post.year, []).append((post, lastmod))
+    for year, entries in years.items():
+        yield f"{SITE_URL}/blog/{year}", "0.5", max(lastmod for _, lastmod in entries)
+        yield from later_pages(f"/blog/{year}", entries, "0.4")
     
-    for url, priority in urls:
-        sitemap += f'''  <url>
-    <loc>{url}</loc>
+    # Ge'ez pages are SEO-focused so give them higher priority
+    for section, priority in (("blog", "0.6"), ("wegoch", "0.6"), ("getem", "0.6"), ("geez", "0.8"), ("cs", "0.7")):
+        for record, lastmod in sections[section]:
+            yield f"{SITE_URL}{record.url}", priority, lastmod
+
+
+class SitemapWriter:
+    """Stream <url> entries into numbered child sitemaps, starting a new one at the protocol limits.
+    
+    Each child is written to a temporary file and only replaces the previous
+    output when its content fingerprint changed.
+    """
+    
+    HEADER = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_XMLNS}">\n'.encode("utf-8")
+    FOOTER = b'</urlset>'
+    
+    def __init__(self, compress: bool = False):
+        self.compress = compress
+        self.children = []  # (name, newest lastmod)
+        self.urls = 0
+        self.written = 0
+        self._file = None
+    
+    def add(self, url: str, priority: str, lastmod: str):
+        entry = f'''  <url>
+    <loc>{html_lib.escape(url, quote=False)}</loc>
+    <lastmod>{lastmod}</lastmod>
     <priority>{priority}</priority>
-  </url>\n'''
+  </url>\n'''.encode("utf-8")
+        if self._file and (self._count == SITEMAP_LIMIT or self._size + len(entry) + len(self.FOOTER) > SITEMAP_MAX_BYTES):
+            self._finish()
+        if not self._file:
+            self._start()
+        self._write(entry)
+        self._count += 1
+        self._lastmod = max(self._lastmod, lastmod)
+        self.urls += 1
+    
+    def close(self):
+        if self._file:
+            self._finish()
+    
+    def _start(self):
+        self._name = f"sitemap-{len(self.children) + 1}.xml" + (".gz" if self.compress else "")
+        self._temp = OUTPUT / f".{self._name}.tmp"
+        self._raw = open(self._temp, "wb")
+        self._file = gzip.GzipFile(fileobj=self._raw, mode="wb", mtime=0, filename="") if self.compress else self._raw
+        self._digest = hashlib.sha256()
+        self._count = 0
+        self._size = 0
+        self._lastmod = ""
+        self._write(self.HEADER)
+    
+    def _write(self, data: bytes):
+        self._file.write(data)
+        self._digest.update(data)
+        self._size += len(data)
+    
+    def _finish(self):
+        self._write(self.FOOTER)
+        self._file.close()
+        self._raw.close()
+        self._file = None
+        output = OUTPUT / self._name
+        if needs_build(output, self._digest.hexdigest()) and replace_output(self._temp, output):
+            self.written += 1
+        else:
+            self._temp.unlink(missing_ok=True)
+        self.children.append((self._name, self._lastmod))
+
+
+def generate_sitemap(index: ContentIndex):
+    """Generate sitemap.xml as an index over streamed child sitemaps."""
+    writer = SitemapWriter(SITEMAP_GZIP)
+    try:
+        for url, priority, lastmod in sitemap_entries(index):
+            writer.add(url, priority, lastmod)
+    finally:
+        writer.close()
+    
+    parts = [f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_XMLNS}">\n']
+    for name, lastmod in writer.children:
+        parts.append(f'''  <sitemap>
+    <loc>{SITE_URL}/{name}</loc>
+    <lastmod>{lastmod}</lastmod>
+  </sitemap>\n''')
+    parts.append('</sitemapindex>')
+    sitemap = "".join(parts)
+    
+    output = OUTPUT / "sitemap.xml"
+    if needs_build(output, sitemap):
+        write_page(output, sitemap)
+        writer.written += 1
+    if writer.written:
+        print(f"✓ Generated sitemap.xml: {writer.urls} URLs in {len(writer.children)} sitemaps")
+
+
+def search_terms(text: str) -> list[str]:
+    """Normalized search terms of text: lowercase, accents and Ethiopic marks dropped, homophones folded.
+    
+    Ethiopic word spaces and punctuation (፡ ። ፣) are not letters, so fidel words split on them.
+    """
+    text = unicodedata.normalize("NFKD", text)
+    marks = {ord(ch): None for ch in set(text) if unicodedata.category(ch).startswith("M")}
+    text = text.translate(marks).lower().translate(ETHIOPIC_FOLD)
+    return [term for term in SEARCH_TERM.findall(text) if len(term) > 1 or not term.isascii()]
+
+
+def search_shard(term: str) -> str:
+    """Shard holding a term: its first character, with a fidel's whole consonant series together."""
+    code = ord(term[0])
+    if 0x1200 <= code < 0x13A0:
+        return f"e{code & ~7:x}"
+    if term[0].isascii():
+        return term[0]
+    return f"u{code:x}"
+
+
+@functools.cache
+def search_signature() -> str:
+    """Fingerprint of everything besides the source that shapes a document's term scores."""
+    return hash_inputs(
+        unicodedata.unidata_version,
+        SEARCH_WEIGHTS,
+        SEARCH_BODY_CAP,
+        SEARCH_TERM.pattern,
+        SEARCH_MARKUP.pattern,
+        ETHIOPIC_FOLD,
+    )
+
+
+def document_terms(record: ContentRecord) -> dict[str, int]:
+    """Weighted search term scores of one content record."""
+    scores = Counter()
+    fields = {
+        "title": f"{record.title} {record.title_transliterated}",
+        "keywords": record.meta.get("keywords", "").strip("[]"),
+        "description": record.description,
+    }
+    for field, text in fields.items():
+        for term in set(search_terms(text)):
+            scores[term] += SEARCH_WEIGHTS[field]
+    body = SEARCH_MARKUP.sub(" ", load_body(record.path))
+    for term, count in Counter(search_terms(body)).items():
+        scores[term] += SEARCH_WEIGHTS["body"] * min(count, SEARCH_BODY_CAP)
+    return dict(scores)
+
+
+def load_search_cache() -> dict:
+    """Document ids and cached term scores from the previous build's search index."""
+    try:
+        cache = json.loads(SEARCH_CACHE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        cache = {}
+    # Ids stay valid across tokenizer changes; term scores do not
+    terms = cache.get("terms", {}) if cache.get("signature") == search_signature() else {}
+    return {"signature": search_signature(), "ids": cache.get("ids", []), "terms": terms}
+
+
+def save_search_cache(cache: dict):
+    """Persist document ids and term scores for the next build."""
+    CACHE.mkdir(exist_ok=True)
+    tmp = SEARCH_CACHE.with_name(f".{SEARCH_CACHE.name}.tmp")
+    tmp.write_text(json.dumps(cache, ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp, SEARCH_CACHE)
+
+
+def build_search_index(index: ContentIndex):
+    """Write the sharded search index over every content section.
+    
+    Term scores are reused from .cache/search.json while a source's digest holds.
+    Document ids are append-only, with null tombstones for removed documents,
+    so adding or deleting a page only rewrites the shards holding its terms.
+    """
+    cache = load_search_cache()
+    records = [(section, record) for section in CONTENT_SECTIONS for record in index.section(section)]
+    live = {record.url for _, record in records}
+    ids = [url if url in live else None for url in cache["ids"]]
+    # Compact once tombstones outnumber documents; this renumbers every shard
+    if ids.count(None) * 2 > len(ids):
+        ids = [url for url in ids if url]
+    doc_ids = {url: doc for doc, url in enumerate(ids) if url}
+    for _, record in records:
+        if record.url not in doc_ids:
+            doc_ids[record.url] = len(ids)
+            ids.append(record.url)
+    
+    docs = [None] * len(ids)
+    terms = {}
+    postings = defaultdict(list)
+    for section, record in records:
+        digest = source_digest(record)
+        cached = cache["terms"].get(record.url)
+        scores = cached[1] if cached and cached[0] == digest else document_terms(record)
+        terms[record.url] = [digest, scores]
+        
+        doc = doc_ids[record.url]
+        description = record.description
+        if len(description) > SEARCH_SNIPPET:
+            description = description[:SEARCH_SNIPPET].rsplit(" ", 1)[0] + "…"
+        docs[doc] = [record.url, record.title, section, description]
+        for term, score in scores.items():
+            postings[term].append((doc, score))
+    
+    updated = {"signature": cache["signature"], "ids": ids, "terms": dict(sorted(terms.items()))}
+    if updated != cache:
+        save_search_cache(updated)
+    
+    shards = defaultdict(dict)
+    for term in sorted(postings):
+        shards[search_shard(term)][term] = [value for pair in sorted(postings[term]) for value in pair]
+    
+    written = 0
+    versions = {}
+    for key, terms in sorted(shards.items()):
+        text = json.dumps(terms, ensure_ascii=False, separators=(",", ":"))
+        versions[key] = hashlib.sha256(text.encode("utf-8")).hexdigest()[:8]
+        output = OUTPUT / "search" / "shards" / f"{key}.json"
+        if needs_build(output, text):
+            write_page(output, text)
+            written += 1
+    
+    manifest = json.dumps({"docs": docs, "shards": versions}, ensure_ascii=False, separators=(",", ":"))
+    output = OUTPUT / "search" / "index.json"
+    if needs_build(output, manifest):
+        write_page(output, manifest)
+        written += 1
+    if written:
+        print(f"✓ Built search index: {len(records)} documents, {len(postings)} terms in {len(shards)} shards")
+
+
+def build_search_page():
+    """Build the search page."""
+    content_html = '''
+        <section class="search-page">
+            <h1 class="section-header">Search</h1>
+            <form class="search-form" action="/search" role="search" data-search>
+                <input type="search" name="q" placeholder="Search posts, wegs, poems, qine… · ፈልግ" aria-label="Search" autocomplete="off" />
+            </form>
+            <p class="search-status" data-search-status></p>
+            <ul class="search-results" data-search-results></ul>
+        </section>
+        <script src="/js/search.js" defer></script>
+    '''
     
-    sitemap += '</urlset>'
+    template = read_template("base.html")
+    output = OUTPUT / "search" / "index.html"
+    if not needs_build(output, template.digest, content_html):
+        return
     
-    (OUTPUT / "sitemap.xml").write_text(sitemap, encoding="utf-8")
-    print("✓ Generated sitemap.xml")
+    html = render_template(
+        template,
+        title="Search",
+        description="Search blog posts, CS articles, wegs, poems and Ge'ez qine by Esubalew Chekol.",
+        keywords="search, ፈልግ, Esubalew Chekol",
+        og_title="Search - Esubalew Chekol",
+        og_description="Search posts, stories, poems and qine.",
+        og_image=f"{SITE_URL}/assets/og-image.png",
+        og_type="website",
+        canonical_url=f"{SITE_URL}/search",
+        content=content_html,
+    )
+    
+    write_page(output, html)
+    print("✓ Built search/index.html")
+
+
+def feed_time(date: str) -> str:
+    """RFC 3339 timestamp for a W3C date."""
+    return f"{date}T00:00:00Z"
+
+
+def atom_feed(title: str, url: str, feed_url: str, entries: list[tuple[ContentRecord, str]]) -> str:
+    """Atom document for (record, lastmod) entries, newest first."""
+    escape = html_lib.escape
+    updated = max((lastmod for _, lastmod in entries), default="1970-01-01")
+    parts = [f'''<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>{escape(title)}</title>
+  <id>{url}</id>
+  <link href="{url}" />
+  <link rel="self" href="{feed_url}" />
+  <updated>{feed_time(updated)}</updated>
+  <author><name>{FEED_AUTHOR}</name></author>
+''']
+    for record, lastmod in entries:
+        link = f"{SITE_URL}{record.url}"
+        published = f"\n    <published>{feed_time(record.date_iso)}</published>" if record.meta.get("date") else ""
+        parts.append(f'''  <entry>
+    <title>{escape(record.title)}</title>
+    <id>{link}</id>
+    <link href="{link}" />
+    <updated>{feed_time(lastmod)}</updated>{published}
+    <summary>{escape(record.description)}</summary>
+  </entry>
+''')
+    parts.append('</feed>\n')
+    return "".join(parts)
+
+
+def json_feed(title: str, url: str, feed_url: str, entries: list[tuple[ContentRecord, str]]) -> str:
+    """JSON Feed 1.1 document for (record, lastmod) entries, newest first."""
+    items = []
+    for record, lastmod in entries:
+        item = {
+            "id": f"{SITE_URL}{record.url}",
+            "url": f"{SITE_URL}{record.url}",
+            "title": record.title,
+            "content_text": record.description,
+            "summary": record.description,
+            "date_modified": feed_time(lastmod),
+        }
+        if record.meta.get("date"):
+            item["date_published"] = feed_time(record.date_iso)
+        items.append(item)
+    feed = {
+        "version": "https://jsonfeed.org/version/1.1",
+        "title": title,
+        "home_page_url": url,
+        "feed_url": feed_url,
+        "authors": [{"name": FEED_AUTHOR}],
+        "items": items,
+    }
+    return json.dumps(feed, ensure_ascii=False, indent=1) + "\n"
+
+
+def generate_feeds(index: ContentIndex):
+    """Write Atom and JSON feeds per dated section and combined; unchanged feeds are left untouched."""
+    feeds = [("", FEED_AUTHOR, index.latest(FEED_LIMIT, tuple(FEED_SECTIONS)))]
+    feeds += [(f"/{section}", f"{label} - {FEED_AUTHOR}", index.section(section)[:FEED_LIMIT])
+              for section, label in FEED_SECTIONS.items() if index.section(section)]
+    
+    written = 0
+    for base, title, records in feeds:
+        entries = [(record, record_lastmod(record)) for record in records]
+        url = f"{SITE_URL}{base}"
+        for name, render in (("feed.xml", atom_feed), ("feed.json", json_feed)):
+            text = render(title, url, f"{url}/{name}", entries)
+            output = OUTPUT / base.lstrip("/") / name
+            if needs_build(output, text):
+                write_page(output, text)
+                written += 1
+    if written:
+        print(f"✓ Generated {written} feeds")
 
 
 def generate_og_images():
@@ -961,37 +2582,440 @@ def generate_og_images():
         print(f"OG generation failed: {e}")
 
 
-def main():
-    """Build the site."""
-    print("\nBuilding site...\n")
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse command-line options."""
+    parser = argparse.ArgumentParser(description="Build esubalew.dev into dist/.")
+    parser.add_argument(
+        "command",
+        nargs="?",
+        choices=["build", "serve", "deploy"],
+        default="build",
+        help="build the site once (default), serve dist/ and rebuild on changes, "
+        "or deploy the files that changed since the target's last deploy",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="keep dist/ and only rebuild pages whose inputs changed since the last build",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        metavar="N",
+        help="number of processes used to render markdown (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="neither read nor write the rendered-HTML cache in .cache/render/",
+    )
+    parser.add_argument(
+        "--sync-hash",
+        action="store_true",
+        help="when a static file's size matches but its mtime differs, compare content hashes before copying",
+    )
+    parser.add_argument(
+        "--link-static",
+        action="store_true",
+        help="hard-link static files into dist/ instead of copying them (falls back to copying)",
+    )
+    parser.add_argument(
+        "--gzip-sitemaps",
+        action="store_true",
+        help="write the child sitemaps listed by sitemap.xml gzip-compressed",
+    )
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=PAGE_SIZE,
+        help=f"entries per page of the blog and works indexes (default: {PAGE_SIZE})",
+    )
+    parser.add_argument(
+        "--minify",
+        action="store_true",
+        help="collapse whitespace and drop comments in HTML pages and stylesheets",
+    )
+    parser.add_argument(
+        "--critical-css",
+        action="store_true",
+        help="inline the CSS each page's first screen uses and load stylesheets asynchronously",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        help="write .gz and .br (with brotli installed) siblings for text files in dist/",
+    )
+    parser.add_argument(
+        "--no-font-subset",
+        action="store_true",
+        help="serve the full TTF fonts instead of WOFF2 subsets of the characters in use",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        type=Path,
+        const=CACHE / "build-trace.json",
+        metavar="TRACE",
+        help="time each phase and page, render serially, and write a trace-event JSON file "
+        "(default: .cache/build-trace.json)",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=10,
+        metavar="N",
+        help="number of slowest pages to report with --profile (default: 10)",
+    )
+    parser.add_argument("--host", default="127.0.0.1", help="address for serve (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8000, help="port for serve (default: 8000)")
+    parser.add_argument("--target", type=Path, metavar="DIR", help="directory deploy writes to")
+    parser.add_argument(
+        "--object-store",
+        action="store_true",
+        help="treat the deploy target as an object store: blobs by SHA-256 plus a key manifest",
+    )
+    parser.add_argument("--dry-run", action="store_true", help="list what deploy would transfer without writing")
+    args = parser.parse_args(argv)
+    if args.command == "deploy" and args.target is None:
+        parser.error("deploy needs --target DIR")
+    return args
+
+
+# Build profiling (--profile); None when disabled
+_profiler = None
+
+
+class Profiler:
+    """Wall time and call counts per phase and per page, plus a trace of every span."""
+    
+    def __init__(self):
+        self.start = time.perf_counter()
+        self.phases = defaultdict(lambda: [0, 0.0])
+        self.pages = defaultdict(float)
+        self.events = []
+    
+    @contextlib.contextmanager
+    def phase(self, name: str, page: Path | None = None):
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - began
+            stats = self.phases[name]
+            stats[0] += 1
+            stats[1] += elapsed
+            event = {
+                "name": name,
+                "ph": "X",
+                "ts": round((began - self.start) * 1e6, 1),
+                "dur": round(elapsed * 1e6, 1),
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+            }
+            if page is not None:
+                key = page.relative_to(OUTPUT).as_posix()
+                self.pages[key] += elapsed
+                event["args"] = {"page": key}
+            self.events.append(event)
+    
+    def report(self, top: int):
+        """Print per-phase totals and the slowest pages."""
+        print(f"\n{'phase':<22}{'calls':>8}{'total ms':>12}{'mean ms':>10}")
+        for name, (calls, total) in sorted(self.phases.items(), key=lambda item: -item[1][1]):
+            print(f"{name:<22}{calls:>8}{total * 1000:>12.1f}{total * 1000 / calls:>10.2f}")
+        
+        if self.pages:
+            print(f"\nSlowest {min(top, len(self.pages))} pages:")
+            for key, total in heapq.nlargest(top, self.pages.items(), key=lambda item: item[1]):
+                print(f"  {total * 1000:8.1f} ms  {key}")
+    
+    def write_trace(self, path: Path):
+        """Write a Chrome trace-event file (chrome://tracing, Perfetto)."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({"traceEvents": self.events}), encoding="utf-8")
+
+
+def profile_phase(name: str, page: Path | None = None):
+    """Time a block under name (and page) when profiling; a no-op otherwise."""
+    if _profiler is None:
+        return contextlib.nullcontext()
+    return _profiler.phase(name, page)
+
+
+def _profiled_highlight(*args, **kwargs):
+    """Pygments' highlight(), timed separately from the surrounding Markdown work."""
+    with profile_phase("pygments"):
+        return highlight(*args, **kwargs)
+
+
+# Dev server: live-reload endpoint and the script injected into served pages
+RELOAD_PATH = "/__reload"
+RELOAD_SCRIPT = (
+    f'<script>new EventSource("{RELOAD_PATH}").onmessage = () => location.reload();</script>'
+)
+WATCH_INTERVAL = 0.1
+_reload = threading.Condition()
+_generation = 0
+
+
+def watch_snapshot(roots: list[Path]) -> dict[str, tuple[int, int]]:
+    """Map every file under roots to its (mtime_ns, size), skipping editor temp files."""
+    stamps = {}
+    stack = [str(root) for root in roots if root.exists()]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for item in it:
+                if item.name.startswith(".") or item.name.endswith("~"):
+                    continue
+                if item.is_dir():
+                    stack.append(item.path)
+                else:
+                    try:
+                        stat = item.stat()
+                    except FileNotFoundError:
+                        continue
+                    stamps[item.path] = (stat.st_mtime_ns, stat.st_size)
+    return stamps
+
+
+def apply_changes(index: ContentIndex, changed: set[Path]) -> bool:
+    """Update the index and caches for changed files; return True if static files changed."""
+    static_changed = False
+    for path in changed:
+        if path.parent == TEMPLATES:
+            read_template.cache_clear()
+            continue
+        
+        section = next((s for s, root in CONTENT_SECTIONS.items() if path.parent == root), None)
+        if section and path.suffix == ".md" and path.name != "index.md":
+            if path.exists():
+                index.add(load_record(section, path))
+            else:
+                index.remove(section, path.stem)
+        elif path.parent != CONTENT:
+            # CSS, assets and misloch images
+            static_changed = True
+    return static_changed
+
+
+class DevRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serve dist/ with live reload injected into HTML pages."""
     
-    # Try to generate OG images first
-    generate_og_images()
-    print()
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, directory=str(OUTPUT), **kwargs)
     
-    # Clean output directory
-    if OUTPUT.exists():
-        shutil.rmtree(OUTPUT)
-    OUTPUT.mkdir()
+    def log_message(self, format, *args):
+        pass
     
-    # Get blog posts
-    posts = get_blog_posts()
-    print(f"Found {len(posts)} blog posts\n")
+    def do_GET(self):
+        url_path = self.path.split("?", 1)[0]
+        if url_path == RELOAD_PATH:
+            self.stream_reloads()
+            return
+        
+        path = Path(self.translate_path(self.path))
+        if path.is_dir() and url_path.endswith("/"):
+            path = path / "index.html"
+        if not path.exists():
+            self.send_html(OUTPUT / "404.html", 404)
+        elif path.suffix == ".html":
+            self.send_html(path, 200)
+        else:
+            super().do_GET()
     
-    # Build pages
-    build_home(posts)
-    build_blog_index(posts)
-    build_blog_posts(posts)
-    build_projects()
-    build_resume()
-    build_links()
-    wegs = build_wegoch()
-    poems = build_getem()
-    geez_pages = build_geez()
-    cs_articles = build_cs()
+    def send_html(self, path: Path, status: int):
+        """Send an HTML file with the reload script before </body>."""
+        try:
+            html = path.read_text(encoding="utf-8")
+        except OSError:
+            self.send_error(404)
+            return
+        body = html.replace("</body>", f"{RELOAD_SCRIPT}\n</body>", 1).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def stream_reloads(self):
+        """Server-sent events: one message per completed rebuild."""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        seen = _generation
+        try:
+            while True:
+                with _reload:
+                    _reload.wait_for(lambda: _generation != seen, timeout=15)
+                if _generation != seen:
+                    seen = _generation
+                    self.wfile.write(b"data: reload\n\n")
+                else:
+                    self.wfile.write(b": keep-alive\n\n")
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+
+
+def serve(host: str, port: int):
+    """Serve dist/, rebuilding affected pages and reloading browsers on every change."""
+    global _generation
+    print("\nBuilding site...\n")
+    load_manifest()
+    OUTPUT.mkdir(exist_ok=True)
+    index = discover_content()
+    build_site(index)
+    
+    server = http.server.ThreadingHTTPServer((host, port), DevRequestHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"\nServing {OUTPUT} at http://{host}:{port} (Ctrl+C to stop)\n")
+    
+    roots = [SRC, BLOG, ASSETS]
+    stamps = watch_snapshot(roots)
+    try:
+        while True:
+            time.sleep(WATCH_INTERVAL)
+            current = watch_snapshot(roots)
+            changed = {Path(p) for p in current.keys() ^ stamps.keys()}
+            changed.update(Path(p) for p in current.keys() & stamps.keys() if current[p] != stamps[p])
+            stamps = current
+            if not changed:
+                continue
+            
+            start = time.perf_counter()
+            load_manifest()
+            static_changed = apply_changes(index, changed)
+            build_site(index, static=static_changed)
+            with _reload:
+                _generation += 1
+                _reload.notify_all()
+            elapsed = (time.perf_counter() - start) * 1000
+            print(f"↻ Rebuilt {len(changed)} changed file(s) in {elapsed:.0f} ms\n")
+    except KeyboardInterrupt:
+        print("\nStopped.")
+    finally:
+        server.shutdown()
+        shutdown_render_pool()
+
+
+# Deploy targets keep a {path: sha256} manifest of what they hold, so a deploy
+# transfers only the files that differ from dist/
+DEPLOY_MANIFEST = ".deploy-manifest.json"
+
+
+class DirectoryTarget:
+    """A directory mirroring dist/, such as a mounted web root.
+    
+    Its manifest sits beside the directory, as .<name>.deploy-manifest.json,
+    so the web server does not publish it with the site.
+    """
+    
+    def __init__(self, root: Path):
+        self.root = root
+        root = root.resolve()
+        self.manifest_path = root.parent / f".{root.name}{DEPLOY_MANIFEST}"
+    
+    def manifest(self) -> dict[str, str]:
+        # Earlier deploys kept the manifest inside the target
+        for path in (self.manifest_path, self.root / DEPLOY_MANIFEST):
+            try:
+                return json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+        return {}
+    
+    def put(self, key: str, source: Path, digest: str):
+        target = self.root / key
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_name(f".{target.name}.tmp")
+        shutil.copy2(source, tmp)
+        os.replace(tmp, target)
+    
+    def delete(self, key: str):
+        target = self.root / key
+        target.unlink(missing_ok=True)
+        parent = target.parent
+        while parent != self.root and parent.exists() and not any(parent.iterdir()):
+            parent.rmdir()
+            parent = parent.parent
+    
+    def save_manifest(self, manifest: dict[str, str]):
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(json.dumps(manifest, indent=1, sort_keys=True), encoding="utf-8")
+        if self.manifest_path != self.root / DEPLOY_MANIFEST:
+            (self.root / DEPLOY_MANIFEST).unlink(missing_ok=True)
+
+
+class ObjectStoreTarget(DirectoryTarget):
+    """Local stand-in for an object store: blobs under objects/ named by SHA-256, keys in the manifest.
+    
+    Identical files share one blob, and a blob is uploaded only once. Nothing
+    here is served directly, so the manifest stays inside the store.
+    """
+    
+    def __init__(self, root: Path):
+        super().__init__(root)
+        self.manifest_path = root / DEPLOY_MANIFEST
+    
+    def put(self, key: str, source: Path, digest: str):
+        blob = self.root / "objects" / digest[:2] / digest
+        if blob.exists():
+            return
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        tmp = blob.with_name(f".{digest}.tmp")
+        shutil.copyfile(source, tmp)
+        os.replace(tmp, blob)
+    
+    def delete(self, key: str):
+        pass  # the key leaves the manifest; unreferenced blobs are collected afterwards
+    
+    def save_manifest(self, manifest: dict[str, str]):
+        super().save_manifest(manifest)
+        referenced = set(manifest.values())
+        for blob in (self.root / "objects").glob("*/*"):
+            if blob.name not in referenced:
+                blob.unlink()
+
+
+def deploy(target: DirectoryTarget, dry_run: bool = False):
+    """Upload the files of dist/ that differ from what target holds, then delete the ones it no longer has."""
+    if not OUTPUT.exists():
+        raise SystemExit(f"Nothing to deploy: build the site into {OUTPUT} first")
+    load_manifest()
+    record_digests()
+    current = {key: record[2] for key, record in _digests.items()}
+    delta = output_delta(target.manifest(), current)
+    uploads = {**delta["added"], **delta["changed"]}
+    size = sum(_digests[key][0] for key in uploads)
+    
+    print(
+        f"Deploying to {target.root}: {len(delta['added'])} added, {len(delta['changed'])} changed, "
+        f"{len(delta['removed'])} removed ({format_bytes(size)} to upload, "
+        f"{len(current) - len(uploads)} unchanged)"
+    )
+    if dry_run:
+        for label in ("added", "changed", "removed"):
+            for key in delta[label]:
+                print(f"   {label:8} {key}")
+        return
     
-    # Build index pages for works sections
-    build_works_index(wegs, "wegoch", {
+    with ThreadPoolExecutor(max_workers=JOBS) as executor:
+        list(executor.map(lambda item: target.put(item[0], OUTPUT / item[0], item[1]), uploads.items()))
+    for key in delta["removed"]:
+        target.delete(key)
+    # Recorded last, so an interrupted deploy is retried in full next time
+    target.save_manifest(current)
+    print("✓ Deployed")
+
+
+# Index page settings for each works section
+WORKS_INDEXES = {
+    "wegoch": {
         "lang": "am",
         "title": "ወጎች - Wegs",
         "title_ethiopic": "ወጎች",
@@ -1002,9 +3026,8 @@ def main():
         "og_description": "Amharic short stories and reflections",
         "count_label": "ወጎች",
         "show_dates": True,
-    })
-    
-    build_works_index(poems, "getem", {
+    },
+    "getem": {
         "lang": "am",
         "title": "ግጥሞች - Poems",
         "title_ethiopic": "ግጥሞች",
@@ -1015,9 +3038,8 @@ def main():
         "og_description": "Amharic poems and verses",
         "count_label": "ግጥሞች",
         "show_dates": True,
-    })
-    
-    build_works_index(geez_pages, "geez", {
+    },
+    "geez": {
         "lang": "gez",
         "title": "ግእዝ - Ge'ez",
         "title_ethiopic": "ግእዝ",
@@ -1027,9 +3049,8 @@ def main():
         "og_title": "ግእዝ - Ethiopian Sacred Texts",
         "og_description": "Ge'ez qine and sacred verses with translations",
         "count_label": "ቅኔዎች",
-    })
-    
-    build_works_index(cs_articles, "cs", {
+    },
+    "cs": {
         "lang": "en",
         "title": "CS - Computer Science",
         "title_ethiopic": "CS",
@@ -1040,20 +3061,156 @@ def main():
         "og_description": "Technical articles and software explorations",
         "count_label": "articles",
         "show_dates": True,
-    })
+    },
+}
+
+
+def build_site(index: ContentIndex, static: bool = True):
+    """Build every page from the content index, then static files and the sitemap."""
+    posts = index.section("blog")
+    _over_budget.clear()
+    # Turning --compress on or off revisits every static file, so its siblings follow
+    if _manifest.get("compressed", False) != COMPRESS:
+        static = True
+    
+    # Resize images first so pages can reference their variants
+    with profile_phase("prepare_images"):
+        prepare_images()
+    
+    # Build pages
+    with profile_phase("build_home"):
+        build_home(posts)
+    with profile_phase("build_blog_index"):
+        build_blog_index(index)
+    with profile_phase("build_blog_posts"):
+        build_blog_posts(posts)
+    with profile_phase("build_pages"):
+        build_projects()
+        build_resume()
+        build_links()
+    with profile_phase("build_wegoch"):
+        build_wegoch(index.section("wegoch"))
+    with profile_phase("build_getem"):
+        build_getem(index.section("getem"))
+    with profile_phase("build_geez"):
+        build_geez(index.section("geez"))
+    with profile_phase("build_cs"):
+        build_cs(index.section("cs"))
+    
+    # Build index pages for works sections
+    with profile_phase("build_works_index"):
+        for section, config in WORKS_INDEXES.items():
+            build_works_index(index.section(section), section, config)
     
     build_404()
     
+    with profile_phase("search"):
+        build_search_page()
+        build_search_index(index)
+    
     # Copy static files
+    if static:
+        print()
+        with profile_phase("copy_static"):
+            copy_static()
+    with profile_phase("subset_fonts"):
+        subset_fonts()
+    
+    # Generate sitemap and feeds
+    with profile_phase("sitemap"):
+        generate_sitemap(index)
+    with profile_phase("feeds"):
+        generate_feeds(index)
+    
+    if COMPRESS:
+        with profile_phase("compress"):
+            compress_outputs()
+    elif _manifest.get("compressed") and OUTPUT.exists():
+        # The previous build precompressed; drop the siblings of what this build wrote
+        for path in OUTPUT.rglob("*"):
+            if compressed_sibling(path) and (build_output(path.with_suffix("")) or not path.with_suffix("").exists()):
+                path.unlink()
+    
+    if INCREMENTAL:
+        removed = remove_stale_outputs()
+        if removed:
+            print(f"✓ Removed {removed} stale pages")
+    else:
+        removed = remove_unproduced_outputs()
+        if removed:
+            print(f"✓ Removed {removed} files left from earlier builds")
+    record_digests()
+    save_deploy_delta()
+    save_manifest()
+    
+    if _over_budget:
+        print(f"\n✗ {len(_over_budget)} pages over their byte budget:")
+        for page, size, budget in sorted(_over_budget):
+            print(f"   {page}: {format_bytes(size)} (budget {format_bytes(budget)})")
+
+
+def main(argv: list[str] | None = None):
+    """Build the site, serve it with live rebuilds, or deploy it."""
+    global INCREMENTAL, JOBS, USE_RENDER_CACHE, SYNC_HASH, SYNC_LINK, SUBSET_FONTS, COMPRESS, MINIFY, CRITICAL_CSS, PAGE_SIZE, SITEMAP_GZIP, _profiler
+    args = parse_args(argv)
+    INCREMENTAL = args.incremental or args.command == "serve"
+    JOBS = max(1, args.jobs)
+    USE_RENDER_CACHE = not args.no_cache
+    SYNC_HASH = args.sync_hash
+    SYNC_LINK = args.link_static
+    SUBSET_FONTS = not args.no_font_subset
+    COMPRESS = args.compress
+    MINIFY = args.minify
+    CRITICAL_CSS = args.critical_css
+    PAGE_SIZE = max(1, args.page_size)
+    SITEMAP_GZIP = args.gzip_sitemaps
+    
+    if args.profile and args.command == "build":
+        # Per-page timings need every page rendered in this process
+        _profiler = Profiler()
+        JOBS = 1
+        codehilite.highlight = _profiled_highlight
+    
+    if args.command == "serve":
+        serve(args.host, args.port)
+        return
+    
+    if args.command == "deploy":
+        target_type = ObjectStoreTarget if args.object_store else DirectoryTarget
+        deploy(target_type(args.target.resolve()), args.dry_run)
+        return
+    
+    print("\nBuilding site...\n")
+    
+    # Try to generate OG images first
+    with profile_phase("og_images"):
+        generate_og_images()
     print()
-    copy_static()
     
-    # Generate sitemap
-    generate_sitemap(posts, wegs, poems, geez_pages, cs_articles)
+    # A full build rewrites only changed files and removes leftovers at the end
+    load_manifest()
+    OUTPUT.mkdir(exist_ok=True)
+    
+    # Discover and index all content, reading only frontmatter
+    with profile_phase("discover"):
+        index = discover_content()
+    print(f"Found {len(index.section('blog'))} blog posts\n")
+    
+    build_site(index)
+    shutdown_render_pool()
+    if USE_RENDER_CACHE:
+        with profile_phase("prune_cache"):
+            prune_render_cache()
+    if _over_budget:
+        raise SystemExit(1)
     
     print("\nSite built successfully!")
     print(f"   Output: {OUTPUT}\n")
-
+    
+    if _profiler:
+        _profiler.report(args.profile_top)
+        _profiler.write_trace(args.profile)
+        print(f"\nTrace written to {args.profile}\n")
 
 if __name__ == "__main__":
     main()
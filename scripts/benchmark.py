@@ -0,0 +1,518 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the site generator in build.py.
+
+    python scripts/benchmark.py markdown              # per-page Markdown conversion overhead
+    python scripts/benchmark.py build --sizes 100 1k  # synthetic corpora vs stored baselines
+    python scripts/benchmark.py og --count 200        # OG font embedding and rasterization
+
+The build benchmark generates corpora shaped like each section (blog posts
+with code fences and tables, CS articles with HTML blocks, wegs with images,
+poems, and Ge'ez pages in the geez:/meaning:/reference: format) under
+.cache/bench/<size>/. After one untimed build warms the font and image
+caches, it times main() and each build_* function in a fresh process and
+reports peak RSS. OG image generation is excluded here; it has
+its own benchmark, which renders the site's real titles to compare embedding
+the whole Ethiopic font against a per-title subset, and one rasterizer call
+per image against the batched process pool.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "scripts"))
+
+import build  # noqa: E402
+import generate_og_images as og  # noqa: E402
+
+BENCH_DIR = ROOT / ".cache" / "bench"
+BASELINE = Path(__file__).resolve().parent / "benchmark-baseline.json"
+
+# Share of generated pages per section
+SECTION_MIX = {"blog": 0.3, "cs": 0.1, "wegoch": 0.2, "getem": 0.25, "geez": 0.15}
+
+# Smallest valid PNG, used for synthetic weg images
+PIXEL_PNG = bytes.fromhex(
+    "89504e470d0a1a0a0000000d49484452000000010000000108060000001f15c489"
+    "0000000d4944415478da63f8ffff3f030008fc02fe78c4b2b00000000049454e44ae426082"
+)
+
+LATIN = "build render parse token cache index page stream worker lexer graph query rust python async".split()
+ETHIOPIC = "ሰላም ፍቅር ሀገር ዘመን ሰው ልብ ቤት መንገድ ብርሃን ተስፋ እምነት ውሃ ቃል ጊዜ ሕይወት".split()
+
+
+def load_bodies() -> list[str]:
+    """Markdown bodies of every blog post and work in the repository."""
+    files = [f for f in build.BLOG.glob("*.md") if f.name != "index.md"]
+    for section in ("wegoch", "getem", "cs"):
+        files.extend(sorted((build.CONTENT / section).glob("*.md")))
+    return [build.parse_frontmatter(f.read_text(encoding="utf-8"))[1] for f in files]
+
+
+def time_per_page(convert, bodies: list[str], rounds: int) -> float:
+    """Median milliseconds per page for one convert() strategy."""
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        for body in bodies:
+            convert(body)
+        samples.append((time.perf_counter() - start) * 1000 / len(bodies))
+    return statistics.median(samples)
+
+
+def bench_markdown(args: argparse.Namespace):
+    """Compare a fresh converter per page against the pooled converter."""
+    bodies = load_bodies()
+    empty = "Hello *world*."
+    
+    # Warm Pygments' lexer modules so both strategies start equal
+    build.render_markdown("\n".join(bodies))
+    
+    # The old path: a new converter per page and an uncached lexer lookup per code block
+    build.codehilite.get_lexer_by_name = build.get_lexer_by_name
+    fresh = time_per_page(lambda body: build.create_markdown().convert(body), bodies, args.rounds)
+    build.codehilite.get_lexer_by_name = build.get_cached_lexer
+    pooled = time_per_page(build.render_markdown, bodies, args.rounds)
+    
+    fresh_setup = time_per_page(lambda body: build.create_markdown().convert(empty), bodies, args.rounds)
+    pooled_setup = time_per_page(lambda body: build.render_markdown(empty), bodies, args.rounds)
+    
+    print(f"{len(bodies)} pages, median of {args.rounds} rounds (ms/page)")
+    print(f"  fresh converter   {fresh:8.3f}   setup only {fresh_setup:7.3f}")
+    print(f"  pooled converter  {pooled:8.3f}   setup only {pooled_setup:7.3f}")
+    print(f"  saved per page    {fresh - pooled:8.3f}   ({(1 - pooled / fresh) * 100:.1f}%)")
+
+
+def og_titles(sections: tuple[str, ...] = ("blog", "wegoch", "getem", "geez", "cs")) -> list[str]:
+    """Titles of the repository's posts and works in the given sections."""
+    files = []
+    for section in sections:
+        files.extend(f for f in sorted(build.CONTENT_SECTIONS[section].glob("*.md")) if f.name != "index.md")
+    return [t for t in map(og.extract_title_from_md, files) if t]
+
+
+def write_og_svgs(titles: list[str], out: Path, subset: bool = True) -> tuple[list, float, int]:
+    """Write one SVG per title; returns the (svg, png) queue, seconds taken and total bytes."""
+    out.mkdir(parents=True, exist_ok=True)
+    start = time.perf_counter()
+    pending = []
+    for i, title in enumerate(titles):
+        svg = out / f"og-{i}.svg"
+        svg.write_text(og.generate_svg(title, subset=subset), encoding="utf-8")
+        pending.append((svg, out / f"og-{i}.png"))
+    elapsed = time.perf_counter() - start
+    return pending, elapsed, sum(svg.stat().st_size for svg, _ in pending)
+
+
+def convert_one(svg_path: Path, png_path: Path):
+    """Rasterize one SVG the way the OG script did before batching: spawn rsvg-convert, else import cairosvg."""
+    try:
+        subprocess.run(
+            ["rsvg-convert", "-w", str(og.OUTPUT_WIDTH), "-h", str(og.OUTPUT_HEIGHT),
+             str(svg_path), "-o", str(png_path)],
+            check=True,
+            capture_output=True,
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        import cairosvg
+        cairosvg.svg2png(url=str(svg_path), write_to=str(png_path),
+                         output_width=og.OUTPUT_WIDTH, output_height=og.OUTPUT_HEIGHT)
+
+
+def time_rasterize(pending: list, workers: int) -> float:
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        og.rasterize_svgs(pending, workers=workers)
+        return time.perf_counter() - start
+
+
+def bench_og(args: argparse.Namespace):
+    """Time SVG generation and rasterization: font embedding, then per-image against batched."""
+    os.chdir(ROOT)  # the OG script resolves font paths from the repository root
+    out = BENCH_DIR / "og"
+    if out.exists():
+        shutil.rmtree(out)
+    can_rasterize = og.can_rasterize()
+    
+    # Whole font against a per-title subset, on the Ethiopic sections' own titles
+    ethiopic = og_titles(("wegoch", "getem", "geez"))
+    print(f"Font embedding, {len(ethiopic)} wegoch/getem/geez titles")
+    results = {}
+    for label, subset in (("whole font", False), ("subset font", True)):
+        pending, elapsed, size = write_og_svgs(ethiopic, out / label.replace(" ", "-"), subset)
+        raster = time_rasterize(pending, args.jobs) if can_rasterize else None
+        results[label] = (size, raster)
+        raster_note = f", rasterize {raster:.3f} s" if raster is not None else ""
+        print(f"  {label:22} {elapsed:8.3f} s   {build.format_bytes(size / len(ethiopic))} per SVG{raster_note}")
+    (full_size, full_raster), (sub_size, sub_raster) = results.values()
+    print(f"  {'SVG size reduction':22} {(1 - sub_size / full_size) * 100:7.1f}%")
+    if can_rasterize:
+        print(f"  {'rasterize speedup':22} {full_raster / sub_raster:8.2f}x")
+    
+    # One rasterizer call per image against the batched pool
+    titles = og_titles()
+    titles = [titles[i % len(titles)] for i in range(args.count)]
+    pending, elapsed, size = write_og_svgs(titles, out / "batch")
+    print(f"\n{len(titles)} OG images ({sum(map(og.has_ethiopic, titles))} Ethiopic)")
+    print(f"  {'write SVGs':22} {elapsed:8.3f} s   {build.format_bytes(size)} total, "
+          f"{build.format_bytes(size / len(titles))} per image")
+    
+    if not can_rasterize:
+        print("  rasterization skipped - install cairosvg or rsvg-convert")
+        return
+    
+    start = time.perf_counter()
+    for svg, png in pending:
+        convert_one(svg, png)
+    single = time.perf_counter() - start
+    batched = time_rasterize(pending, args.jobs)
+    
+    batch_label = f"batched, {args.jobs} worker(s)"
+    print(f"  {'one call per image':22} {single:8.3f} s   ({single * 1000 / len(titles):.1f} ms/image)")
+    print(f"  {batch_label:22} {batched:8.3f} s   ({batched * 1000 / len(titles):.1f} ms/image)")
+    print(f"  {'speedup':22} {single / batched:8.2f}x")
+
+
+def parse_size(value: str) -> int:
+    """Accept 100, 1k, 10k, 100k."""
+    value = value.lower()
+    return int(value[:-1]) * 1000 if value.endswith("k") else int(value)
+
+
+def words(rng: random.Random, vocab: list[str], count: int) -> str:
+    return " ".join(rng.choice(vocab) for _ in range(count))
+
+
+def frontmatter(fields: dict) -> str:
+    lines = "\n".join(f'{key}: "{value}"' for key, value in fields.items())
+    return f"---\n{lines}\n---\n\n"
+
+
+def blog_post(rng: random.Random, i: int, date: str) -> str:
+    title = f"{words(rng, LATIN, 4).title()} {i}"
+    rows = "\n".join(f"| {words(rng, LATIN, 1)} | {rng.randint(1, 999)} | {words(rng, LATIN, 3)} |" for _ in range(6))
+    return frontmatter({
+        "title": title,
+        "date": date,
+        "description": words(rng, LATIN, 12),
+        "keywords": ", ".join(rng.sample(LATIN, 4)),
+        "og:image": "/assets/og-blog.png",
+    }) + f"""## {words(rng, LATIN, 3).title()}
+
+{words(rng, LATIN, 80)}
+
+```python
+def handler_{i}(items):
+    total = 0
+    for item in items:
+        total += item.weight * {rng.randint(2, 9)}
+    return {{"total": total, "name": "{words(rng, LATIN, 1)}"}}
+```
+
+{words(rng, LATIN, 60)}
+
+| name | value | notes |
+|------|-------|-------|
+{rows}
+
+```rust
+fn main() {{
+    let values: Vec<u32> = (0..{rng.randint(10, 99)}).collect();
+    println!("{{}}", values.iter().sum::<u32>());
+}}
+```
+
+{words(rng, LATIN, 40)}
+"""
+
+
+def cs_article(rng: random.Random, i: int, date: str) -> str:
+    return frontmatter({
+        "title": f"{words(rng, LATIN, 3).title()} {i}",
+        "date": date,
+        "description": words(rng, LATIN, 10),
+    }) + f"""{words(rng, LATIN, 50)}
+
+<div class="terminal">
+<div class="terminal-body">
+<pre><code><span class="prompt">fs-cli '{rng.randint(1, 9)} + {rng.randint(1, 9)}'</span></code></pre>
+</div>
+</div>
+
+## _{words(rng, LATIN, 2)}_
+
+{words(rng, LATIN, 70)}
+
+```javascript
+const result = [{rng.randint(1, 9)}, {rng.randint(1, 9)}].map(x => x * 2);
+```
+"""
+
+
+def weg(rng: random.Random, i: int, date: str) -> str:
+    paragraphs = [f"{words(rng, ETHIOPIC, 60)} ።" for _ in range(6)]
+    paragraphs.insert(2, f"![{words(rng, ETHIOPIC, 2)}](/wegoch/misloch/weg-{i % 10}.png)")
+    paragraphs.insert(5, f"![{words(rng, ETHIOPIC, 2)}](/wegoch/misloch/weg-{(i + 1) % 10}.png)")
+    return frontmatter({
+        "title": f"{words(rng, ETHIOPIC, 2)} {i}",
+        "description": words(rng, ETHIOPIC, 8),
+        "og_image": "/assets/og-image.png",
+        "date": date,
+    }) + "\n\n".join(paragraphs) + "\n"
+
+
+def poem(rng: random.Random, i: int, date: str) -> str:
+    stanzas = []
+    for _ in range(5):
+        lines = "<br>\n".join(f"<span>{words(rng, ETHIOPIC, 5)} ፤</span>" for _ in range(4))
+        stanzas.append(f'<div class="poem spaced">\n{lines}\n</div>')
+    return frontmatter({
+        "title": f"{words(rng, ETHIOPIC, 2)} {i}",
+        "description": words(rng, ETHIOPIC, 6),
+        "date": date,
+    }) + "\n\n".join(stanzas) + "\n"
+
+
+def geez_page(rng: random.Random, i: int, date: str) -> str:
+    return frontmatter({
+        "title": f"{words(rng, ETHIOPIC, 2)} {i}",
+        "title_transliterated": f"{words(rng, LATIN, 2).title()} {i}",
+        "description": words(rng, ETHIOPIC, 8),
+        "og:image": "/assets/og-geez.png",
+    }) + f"""geez:
+{words(rng, ETHIOPIC, 6)}፤
+{words(rng, ETHIOPIC, 6)}።
+
+meaning:
+{words(rng, ETHIOPIC, 12)}።
+
+reference: {words(rng, ETHIOPIC, 2)} ፲፱
+"""
+
+
+GENERATORS = {"blog": blog_post, "cs": cs_article, "wegoch": weg, "getem": poem, "geez": geez_page}
+
+
+def generate_corpus(size: int) -> Path:
+    """Create (once) a synthetic site of size content pages; return its root."""
+    root = BENCH_DIR / str(size)
+    if (root / ".complete").exists():
+        return root
+    if root.exists():
+        shutil.rmtree(root)
+    
+    # Real templates, CSS, single pages and assets; synthetic sections
+    shutil.copytree(build.TEMPLATES, root / "src" / "templates")
+    shutil.copytree(build.CSS, root / "src" / "css")
+    for name in ("index.md", "projects.md", "resume.md", "links.md"):
+        (root / "src" / "content").mkdir(parents=True, exist_ok=True)
+        shutil.copy(build.CONTENT / name, root / "src" / "content" / name)
+    (root / "docs").mkdir()
+    (root / "docs" / "assets").symlink_to(build.ASSETS, target_is_directory=True)
+    
+    rng = random.Random(size)
+    dirs = {
+        "blog": root / "docs" / "blog",
+        **{s: root / "src" / "content" / s for s in ("cs", "wegoch", "getem", "geez")},
+    }
+    for section, share in SECTION_MIX.items():
+        out = dirs[section]
+        out.mkdir(parents=True, exist_ok=True)
+        for i in range(max(1, int(size * share))):
+            date = f"{rng.randint(2015, 2025)}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}"
+            (out / f"{section}-{i:06d}.md").write_text(GENERATORS[section](rng, i, date), encoding="utf-8")
+    
+    misloch = dirs["wegoch"] / "misloch"
+    misloch.mkdir()
+    for i in range(10):
+        (misloch / f"weg-{i}.png").write_bytes(PIXEL_PNG)
+    
+    (root / ".complete").touch()
+    return root
+
+
+def use_tree(root: Path):
+    """Point build.py's path constants at another site tree."""
+    build.ROOT = root
+    build.SRC = root / "src"
+    build.CONTENT = build.SRC / "content"
+    build.TEMPLATES = build.SRC / "templates"
+    build.CSS = build.SRC / "css"
+    build.JS = build.SRC / "js"
+    build.BLOG = root / "docs" / "blog"
+    build.ASSETS = root / "docs" / "assets"
+    build.OUTPUT = root / "dist"
+    build.CACHE = root / ".cache"
+    build.MANIFEST = build.CACHE / "build-manifest.json"
+    build.DEPLOY_DELTA = build.CACHE / "deploy-delta.json"
+    build.RENDER_CACHE = build.CACHE / "render"
+    build.SEARCH_CACHE = build.CACHE / "search.json"
+    build.FONT_CACHE = build.CACHE / "fonts"
+    build.IMAGE_CACHE = build.CACHE / "images"
+    build.CONTENT_SECTIONS = {
+        "blog": build.BLOG,
+        **{s: build.CONTENT / s for s in ("wegoch", "getem", "geez", "cs")},
+    }
+    build.read_template.cache_clear()
+
+
+def timed(results: dict, name: str, func, *args):
+    start = time.perf_counter()
+    func(*args)
+    results[name] = time.perf_counter() - start
+
+
+def run_build(root: Path, jobs: int) -> dict:
+    """Time a warm full main() and then each step of build_site() in order; runs in a fresh process."""
+    use_tree(root)
+    build.generate_og_images = lambda: None
+    results = {}
+    
+    with contextlib.redirect_stdout(io.StringIO()):
+        # Untimed pass so a fresh corpus has warm font and image caches
+        build.main(["--no-cache", "--jobs", str(jobs)])
+        timed(results, "main", build.main, ["--no-cache", "--jobs", str(jobs)])
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        
+        shutil.rmtree(build.OUTPUT)
+        build.OUTPUT.mkdir()
+        build.load_manifest()
+        start = time.perf_counter()
+        index = build.discover_content()
+        results["discover_content"] = time.perf_counter() - start
+        posts = index.section("blog")
+        
+        timed(results, "prepare_images", build.prepare_images)
+        timed(results, "build_home", build.build_home, posts)
+        timed(results, "build_blog_index", build.build_blog_index, index)
+        timed(results, "build_blog_posts", build.build_blog_posts, posts)
+        start = time.perf_counter()
+        build.build_projects()
+        build.build_resume()
+        build.build_links()
+        results["build_pages"] = time.perf_counter() - start
+        for section in ("wegoch", "getem", "geez", "cs"):
+            timed(results, f"build_{section}", getattr(build, f"build_{section}"), index.section(section))
+        start = time.perf_counter()
+        for section, config in build.WORKS_INDEXES.items():
+            build.build_works_index(index.section(section), section, config)
+        results["build_works_index"] = time.perf_counter() - start
+        timed(results, "build_404", build.build_404)
+        timed(results, "build_search_page", build.build_search_page)
+        timed(results, "build_search_index", build.build_search_index, index)
+        timed(results, "copy_static", build.copy_static)
+        timed(results, "subset_fonts", build.subset_fonts)
+        timed(results, "generate_sitemap", build.generate_sitemap, index)
+        timed(results, "generate_feeds", build.generate_feeds, index)
+        build.shutdown_render_pool()
+    
+    # ru_maxrss is KiB on Linux, bytes on macOS
+    scale = 1 if sys.platform == "darwin" else 1024
+    results["peak_rss_mb"] = rss * scale / 2**20
+    results["pages"] = len(index)
+    return results
+
+
+def compare(size: int, results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Names of metrics slower (or larger) than baseline by more than tolerance."""
+    regressions = []
+    for name, base in baseline.get(str(size), {}).items():
+        current = results.get(name)
+        if name == "pages" or current is None or not base:
+            continue
+        # Ignore jitter on steps that take a few milliseconds or megabytes
+        floor = 1.0 if name.endswith("_mb") else 0.01
+        if current > base * (1 + tolerance) and current - base > floor:
+            regressions.append(f"{name} {current:.3f} vs {base:.3f}")
+    return regressions
+
+
+def bench_build(args: argparse.Namespace):
+    """Benchmark synthetic corpora of each size against stored baselines."""
+    baseline = json.loads(BASELINE.read_text()) if BASELINE.exists() else {}
+    failed = False
+    
+    for size in args.sizes:
+        start = time.perf_counter()
+        root = generate_corpus(size)
+        print(f"\n== {size} pages (corpus ready in {time.perf_counter() - start:.1f}s)")
+        
+        proc = subprocess.run(
+            [sys.executable, __file__, "run-build", str(root), "--jobs", str(args.jobs)],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results = json.loads(proc.stdout.strip().splitlines()[-1])
+        
+        base = baseline.get(str(size), {})
+        print(f"  {'pages':<20}{results['pages']:>10}")
+        for name, value in results.items():
+            if name == "pages":
+                continue
+            unit = "MB" if name.endswith("_mb") else "s"
+            ref = f"   (baseline {base[name]:.3f})" if name in base else ""
+            print(f"  {name:<20}{value:>10.3f} {unit}{ref}")
+        
+        regressions = compare(size, results, baseline, args.tolerance)
+        for line in regressions:
+            print(f"  REGRESSION {line}")
+        failed |= bool(regressions)
+        
+        if args.save_baseline:
+            baseline[str(size)] = {k: round(v, 4) for k, v in results.items() if k != "pages"}
+    
+    if args.save_baseline:
+        BASELINE.write_text(json.dumps(baseline, indent=2, sort_keys=True) + "\n")
+        print(f"\nBaseline written to {BASELINE.relative_to(ROOT)}")
+    if failed:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark build.py.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    
+    md = sub.add_parser("markdown", help="per-page Markdown conversion overhead")
+    md.add_argument("--rounds", type=int, default=5)
+    md.set_defaults(func=bench_markdown)
+    
+    b = sub.add_parser("build", help="time build.py on synthetic corpora")
+    b.add_argument("--sizes", nargs="+", type=parse_size, default=[100, 1000], metavar="N",
+                   help="corpus sizes in pages, e.g. 100 1k 10k 100k (default: 100 1k)")
+    b.add_argument("--jobs", type=int, default=1, help="--jobs passed to build.py (default: 1)")
+    b.add_argument("--tolerance", type=float, default=0.25,
+                   help="allowed slowdown over baseline before failing (default: 0.25)")
+    b.add_argument("--save-baseline", action="store_true", help=f"store results in {BASELINE.name}")
+    b.set_defaults(func=bench_build)
+    
+    o = sub.add_parser("og", help="OG image SVG writing and rasterization")
+    o.add_argument("--count", type=int, default=200, help="number of images (default: 200)")
+    o.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                   help="rasterization workers (default: CPU count)")
+    o.set_defaults(func=bench_og)
+    
+    run = sub.add_parser("run-build", help=argparse.SUPPRESS)
+    run.add_argument("root", type=Path)
+    run.add_argument("--jobs", type=int, default=1)
+    run.set_defaults(func=lambda args: print(json.dumps(run_build(args.root, args.jobs))))
+    
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
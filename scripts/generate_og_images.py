@@ -4,9 +4,17 @@ Auto-generate OG images for blog posts, wegs, and poems based on their titles.
 Supports Amharic/Ethiopic text using embedded Ethiopian fonts.
 """
 
+import os
+import io
 import base64
+import functools
+import hashlib
+import json
+import logging
 import re
+import shutil
 import subprocess
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
 # Configuration
@@ -20,13 +28,30 @@ FONT_DIR = Path("docs/assets")
 OUTPUT_WIDTH = 1200
 OUTPUT_HEIGHT = 630
 
+# Batch rasterization: SVGs are split into chunks, each converted by one worker
+OG_JOBS = os.cpu_count() or 1
+CHUNKS_PER_WORKER = 4
+
 # Ethiopian font for Amharic text
 ETHIOPIC_FONT_PATH = FONT_DIR / "AddisAbebaUnicode.ttf"
 ETHIOPIC_FONT_BOLD_PATH = FONT_DIR / "EthiopicLeTewahedo-Bold.ttf"
+# The base64 payload of a font embedded in an SVG
+FONT_DATA = re.compile(r"base64,[A-Za-z0-9+/=]+")
+
+# Records which source produced each image and the hash of its SVG, so only
+# images whose title, font or template changed are regenerated
+OG_MANIFEST = Path("docs/og-manifest.json")
 
 # Cache for embedded font
 _font_cache = {}
 
+# Font subsets by font hash and title, so unchanged titles skip fontTools
+SUBSET_CACHE = Path(".cache/og-fonts")
+
+# Manifest entries from the previous run, and those written by this one
+_manifest = {}
+_current = {}
+
 
 def has_ethiopic(text: str) -> bool:
     """Check if text contains Ethiopic characters."""
@@ -37,8 +62,50 @@ def has_ethiopic(text: str) -> bool:
     return False
 
 
-def get_embedded_font(font_path: Path) -> str:
-    """Get base64-encoded font for embedding in SVG."""
+@functools.cache
+def font_hash(font_path: Path) -> str:
+    return hashlib.sha256(font_path.read_bytes()).hexdigest()
+
+
+def subset_font(font_path: Path, text: str) -> bytes | None:
+    """TrueType font holding only the glyphs of text, or None without fontTools.
+    
+    Subsets are cached in SUBSET_CACHE, keyed by the font's hash and the text.
+    """
+    key = hashlib.sha256(f"{font_hash(font_path)}\0{''.join(sorted(set(text)))}".encode("utf-8")).hexdigest()
+    cached = SUBSET_CACHE / f"{key}.ttf"
+    if cached.exists():
+        return cached.read_bytes()
+    try:
+        from fontTools import subset
+    except ImportError:
+        return None
+    logging.getLogger("fontTools").setLevel(logging.ERROR)
+    options = subset.Options()
+    options.layout_features = ["*"]
+    font = subset.load_font(str(font_path), options)
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=text)
+    subsetter.subset(font)
+    data = io.BytesIO()
+    subset.save_font(font, data, options)
+    font.close()
+    SUBSET_CACHE.mkdir(parents=True, exist_ok=True)
+    cached.write_bytes(data.getvalue())
+    return data.getvalue()
+
+
+def get_embedded_font(font_path: Path, text: str | None = None) -> str:
+    """Get base64-encoded font for embedding in SVG.
+    
+    With text, the font is subset to the glyphs it uses (when fontTools is
+    installed) instead of embedding the whole file in every SVG.
+    """
+    if text is not None and font_path.exists():
+        data = subset_font(font_path, text)
+        if data is not None:
+            return base64.b64encode(data).decode('ascii')
+    
     if str(font_path) in _font_cache:
         return _font_cache[str(font_path)]
     
@@ -102,16 +169,24 @@ def escape_xml(text: str) -> str:
     )
 
 
-def generate_svg(title: str) -> str:
-    """Generate minimal SVG content for the OG image with font support."""
+def ethiopic_font() -> Path:
+    """Font embedded in Ethiopic titles: the bold face when it is installed."""
+    return ETHIOPIC_FONT_BOLD_PATH if ETHIOPIC_FONT_BOLD_PATH.exists() else ETHIOPIC_FONT_PATH
+
+
+def generate_svg(title: str, subset: bool = True) -> str:
+    """Generate minimal SVG content for the OG image with font support.
+    
+    Ethiopic titles embed the font subset to the title's glyphs unless subset is False.
+    """
     lines = wrap_text(title, 40)
     uses_ethiopic = has_ethiopic(title)
     
     # Font settings
     if uses_ethiopic:
         # Use Ethiopian font for Amharic titles
-        font_path = ETHIOPIC_FONT_BOLD_PATH if ETHIOPIC_FONT_BOLD_PATH.exists() else ETHIOPIC_FONT_PATH
-        font_base64 = get_embedded_font(font_path)
+        font_path = ethiopic_font()
+        font_base64 = get_embedded_font(font_path, title if subset else None)
         font_family = "EthiopicFont, Arial, sans-serif"
         font_size = 48  # Slightly smaller for Ethiopic
         max_chars = 25  # Fewer chars per line for Ethiopic
@@ -176,69 +251,212 @@ def get_og_filename(md_file: Path) -> str:
     return "og-" + "-".join(words)
 
 
-def convert_svg_to_png(svg_path: Path, png_path: Path):
-    """Convert SVG to PNG using available tools."""
+@functools.cache
+def _load_cairosvg():
+    """Import cairosvg, or None when it or the cairo library is missing."""
     try:
-        subprocess.run(
-            ["rsvg-convert", "-w", str(OUTPUT_WIDTH), "-h", str(OUTPUT_HEIGHT), 
-             str(svg_path), "-o", str(png_path)],
-            check=True,
-            capture_output=True
-        )
-        print(f"Generated {png_path.name}")
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
+        import cairosvg
+    except (ImportError, OSError):
+        return None
+    return cairosvg
+
+
+def can_rasterize() -> bool:
+    """Whether cairosvg imports or rsvg-convert is on PATH."""
+    return _load_cairosvg() is not None or shutil.which("rsvg-convert") is not None
+
+
+def rasterize_chunk(pairs: list[tuple[str, str]]) -> list[tuple[str, str, str]]:
+    """Convert (svg, png) path pairs in this process, returning (png name, tool used or "", error).
+    
+    cairosvg is imported once and renders every SVG in-process; rsvg-convert is
+    only spawned per file when cairosvg is unavailable.
+    """
+    cairosvg = _load_cairosvg()
+    results = []
+    for svg_path, png_path in pairs:
+        name = Path(png_path).name
+        if cairosvg:
+            try:
+                cairosvg.svg2png(url=svg_path, write_to=png_path,
+                                 output_width=OUTPUT_WIDTH, output_height=OUTPUT_HEIGHT)
+                results.append((name, "cairosvg", ""))
+            except Exception as e:
+                # One bad SVG must not lose the rest of the chunk
+                Path(png_path).unlink(missing_ok=True)
+                results.append((name, "", str(e) or type(e).__name__))
+            continue
         try:
-            import cairosvg
-            cairosvg.svg2png(url=str(svg_path), write_to=str(png_path), 
-                           output_width=OUTPUT_WIDTH, output_height=OUTPUT_HEIGHT)
-            print(f"Generated {png_path.name} (via cairosvg)")
-            return True
-        except ImportError:
-            print("PNG conversion skipped - install cairosvg or rsvg-convert")
-            return False
+            subprocess.run(
+                ["rsvg-convert", "-w", str(OUTPUT_WIDTH), "-h", str(OUTPUT_HEIGHT),
+                 svg_path, "-o", png_path],
+                check=True,
+                capture_output=True
+            )
+            results.append((name, "rsvg-convert", ""))
+        except subprocess.CalledProcessError as e:
+            results.append((name, "", e.stderr.decode("utf-8", "replace").strip() or str(e)))
+        except FileNotFoundError as e:
+            results.append((name, "", str(e)))
+    return results
+
+
+def rasterize_svgs(pending: list[tuple[Path, Path]], workers: int = OG_JOBS) -> set[str]:
+    """Convert queued SVGs to PNG across a process pool, reporting progress.
+    
+    Returns the names of the PNGs written.
+    """
+    if not pending:
+        return set()
+    if not can_rasterize():
+        print("PNG conversion skipped - install cairosvg or rsvg-convert")
+        return set()
+    
+    pairs = [(str(svg), str(png)) for svg, png in pending]
+    workers = max(1, min(workers, len(pairs)))
+    size = max(1, -(-len(pairs) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [pairs[i:i + size] for i in range(0, len(pairs), size)]
+    
+    print(f"\n🖼️  Rasterizing {len(pairs)} OG images with {workers} worker(s)...")
+    done = 0
+    converted = set()
+    tools = set()
+    if workers == 1:
+        results = map(rasterize_chunk, chunks)
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = (future.result() for future in as_completed([pool.submit(rasterize_chunk, c) for c in chunks]))
+    try:
+        for chunk_results in results:
+            for name, tool, error in chunk_results:
+                done += 1
+                if tool:
+                    converted.add(name)
+                    tools.add(tool)
+                else:
+                    print(f"  ⚠️  {name} failed: {error}")
+            print(f"  {done}/{len(pairs)} processed")
+    finally:
+        if workers > 1:
+            pool.shutdown()
+    
+    if tools:
+        print(f"Generated {len(converted)} PNGs (via {', '.join(sorted(tools))})")
+    if len(converted) < len(pairs):
+        print(f"⚠️  {len(pairs) - len(converted)} PNGs failed to convert")
+    return converted
+
 
+def load_og_manifest():
+    """Load the image records written by the previous run."""
+    global _manifest
+    _current.clear()
+    try:
+        _manifest = json.loads(OG_MANIFEST.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        _manifest = {}
+
+
+def save_og_manifest():
+    """Persist the records of every image that has a source."""
+    OG_MANIFEST.write_text(json.dumps(dict(sorted(_current.items())), indent=1) + "\n", encoding="utf-8")
+
+
+def og_key(svg_content: str) -> str:
+    """Hash of an image's inputs: the SVG embeds the title, font and template."""
+    return hashlib.sha256(svg_content.encode("utf-8")).hexdigest()[:16]
+
+
+def render_key(svg_content: str) -> str:
+    """Hash of how an image renders: its SVG with the embedded font replaced by the whole font's hash.
+    
+    A subset draws the title exactly as the font it was cut from, so a new
+    subset of the same font leaves the PNG current.
+    """
+    return og_key(FONT_DATA.sub(lambda m: f"base64,{font_hash(ethiopic_font())}", svg_content))
 
-def process_blog_posts():
-    """Process blog posts directory."""
+
+def normalize_svg(svg_content: str) -> str:
+    """SVG text without indentation or blank lines, for comparing older output."""
+    return "\n".join(line.strip() for line in svg_content.splitlines() if line.strip())
+
+
+def refresh_og_image(md_file: Path, og_dir: Path, og_base: str, pending: list[tuple[Path, Path]], force: bool = False) -> bool | None:
+    """Write md_file's OG SVG unless the recorded one was made from the same inputs.
+    
+    Queues the PNG in pending when it is missing or out of date. Returns True when
+    the SVG was regenerated, False when it was current, None without a title.
+    """
+    title = extract_title_from_md(md_file)
+    if not title:
+        print(f"Skipping {md_file.name} - No title found")
+        return None
+    
+    og_png = og_dir / f"{og_base}.png"
+    og_svg = og_dir / f"{og_base}.svg"
+    name = og_svg.with_suffix("").as_posix()
+    svg_content = generate_svg(title)
+    key = og_key(svg_content)
+    render = render_key(svg_content)
+    
+    record = _manifest.get(name)
+    if record is None and og_svg.exists() and normalize_svg(og_svg.read_text(encoding="utf-8")) == normalize_svg(svg_content):
+        # Made before the manifest existed, from the same title: adopt it
+        record = {"key": key, "render": render, "png": og_png.exists()}
+    current = not force and record is not None and record["key"] == key and og_svg.exists()
+    # Only the render key decides the PNG; re-subsetting the font changes the SVG alone
+    png_current = not force and record is not None and record.get("png", False) and record.get("render") == render and og_png.exists()
+    _current[name] = {"source": md_file.as_posix(), "key": key, "render": render, "png": png_current}
+    
+    if current and png_current:
+        print(f"⏭️  Skipping {md_file.name} - OG image is current")
+        return False
+    if not current:
+        og_svg.write_text(svg_content, encoding="utf-8")
+        print(f"Generated {og_svg.name}")
+    if not png_current:
+        pending.append((og_svg, og_png))
+    return not current
+
+
+def prune_og_images() -> int:
+    """Delete images recorded for sources that no longer produce them."""
+    removed = 0
+    for name in _manifest:
+        if name in _current:
+            continue
+        for suffix in (".svg", ".png"):
+            stale = Path(name + suffix)
+            if stale.exists():
+                stale.unlink()
+                print(f"🗑️  Removed {stale.name}")
+                removed += 1
+    return removed
+
+
+def process_blog_posts(pending: list[tuple[Path, Path]], force_regenerate: bool = False):
+    """Process blog posts directory, queueing PNG conversions in pending."""
     if not BLOG_DIR.exists():
         return 0, 0
     
     generated = 0
     skipped = 0
     
-    for md_file in BLOG_DIR.glob("*.md"):
+    for md_file in sorted(BLOG_DIR.glob("*.md")):
         if md_file.name == "index.md":
             continue
         
-        og_base = get_og_filename(md_file)
-        og_png = BLOG_DIR / f"{og_base}.png"
-        og_svg = BLOG_DIR / f"{og_base}.svg"
-        
-        existing_ogs = list(BLOG_DIR.glob(f"og-*{md_file.stem[:10]}*"))
-        
-        if og_png.exists() or og_svg.exists() or existing_ogs:
-            print(f"⏭️  Skipping {md_file.name} - OG image exists")
+        result = refresh_og_image(md_file, BLOG_DIR, get_og_filename(md_file), pending, force_regenerate)
+        if result is False:
             skipped += 1
-            continue
-        
-        title = extract_title_from_md(md_file)
-        if not title:
-            print(f"Skipping {md_file.name} - No title found")
-            continue
-        
-        svg_content = generate_svg(title)
-        og_svg.write_text(svg_content, encoding="utf-8")
-        print(f"Generated {og_svg.name}")
-        
-        convert_svg_to_png(og_svg, og_png)
-        generated += 1
+        elif result:
+            generated += 1
     
     return generated, skipped
 
 
-def process_works(content_dir: Path, work_type: str, force_regenerate: bool = False):
-    """Process wegs or poems directory."""
+def process_works(content_dir: Path, work_type: str, pending: list[tuple[Path, Path]], force_regenerate: bool = False):
+    """Process wegs or poems directory, queueing PNG conversions in pending."""
     if not content_dir.exists():
         return 0, 0
     
@@ -248,35 +466,19 @@ def process_works(content_dir: Path, work_type: str, force_regenerate: bool = Fa
     # Ensure assets directory exists
     ASSETS_DIR.mkdir(parents=True, exist_ok=True)
     
-    for md_file in content_dir.glob("*.md"):
+    for md_file in sorted(content_dir.glob("*.md")):
         if md_file.name == "index.md":
             continue
         
         # OG images go to assets with work type prefix
         og_base = f"og-{work_type}-{md_file.stem}"
-        og_png = ASSETS_DIR / f"{og_base}.png"
-        og_svg = ASSETS_DIR / f"{og_base}.svg"
-        
-        if not force_regenerate and (og_png.exists() or og_svg.exists()):
-            print(f"⏭️  Skipping {md_file.name} - OG image exists")
+        result = refresh_og_image(md_file, ASSETS_DIR, og_base, pending, force_regenerate)
+        if result is False:
             skipped += 1
-            continue
-        
-        title = extract_title_from_md(md_file)
-        if not title:
-            print(f"Skipping {md_file.name} - No title found")
-            continue
-        
-        svg_content = generate_svg(title)
-        og_svg.write_text(svg_content, encoding="utf-8")
-        print(f"Generated {og_svg.name}")
-        
-        convert_svg_to_png(og_svg, og_png)
-        
-        # Update the markdown file to use the new OG image
-        update_og_image_in_md(md_file, f"/assets/{og_base}.png")
-        
-        generated += 1
+        elif result:
+            # Update the markdown file to use the new OG image
+            update_og_image_in_md(md_file, f"/assets/{og_base}.png")
+            generated += 1
     
     return generated, skipped
 
@@ -307,25 +509,36 @@ def main():
     if force:
         print("Force regenerating all OG images...\n")
     
+    # SVGs are written as titles are processed; PNGs are rasterized in one batch
+    pending = []
+    load_og_manifest()
+    
     print("Processing blog posts...")
-    blog_gen, blog_skip = process_blog_posts()
+    blog_gen, blog_skip = process_blog_posts(pending, force_regenerate=force)
     
     print("\n📖 Processing wegs...")
-    weg_gen, weg_skip = process_works(WEGOCH_DIR, "weg", force_regenerate=force)
+    weg_gen, weg_skip = process_works(WEGOCH_DIR, "weg", pending, force_regenerate=force)
     
     print("\n📜 Processing poems...")
-    poem_gen, poem_skip = process_works(GETEM_DIR, "getem", force_regenerate=force)
+    poem_gen, poem_skip = process_works(GETEM_DIR, "getem", pending, force_regenerate=force)
     
     print("\n📿 Processing Ge'ez...")
-    geez_gen, geez_skip = process_works(GEEZ_DIR, "geez", force_regenerate=force)
+    geez_gen, geez_skip = process_works(GEEZ_DIR, "geez", pending, force_regenerate=force)
     
     print("\n💻 Processing CS articles...")
-    cs_gen, cs_skip = process_works(CS_DIR, "cs", force_regenerate=force)
+    cs_gen, cs_skip = process_works(CS_DIR, "cs", pending, force_regenerate=force)
+    
+    converted = rasterize_svgs(pending)
+    for og_svg, og_png in pending:
+        _current[og_svg.with_suffix("").as_posix()]["png"] = og_png.name in converted
+    
+    removed = prune_og_images()
+    save_og_manifest()
     
     total_gen = blog_gen + weg_gen + poem_gen + geez_gen + cs_gen
     total_skip = blog_skip + weg_skip + poem_skip + geez_skip + cs_skip
     
-    print(f"\n📊 Summary: {total_gen} generated, {total_skip} skipped")
+    print(f"\n📊 Summary: {total_gen} generated, {total_skip} skipped, {removed} removed")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,153 @@
+// Site search over the index written by build.py: the manifest lists documents
+// by id (null for removed ones) and shards, and a query fetches only the
+// shards its terms start in.
+// The tokenizer must stay in step with search_terms() in build.py.
+(function () {
+  "use strict";
+
+  var ROOT = "/search/";
+  var LIMIT = 30;
+  // Ethiopic homophone series folded to one spelling: ሐ/ኀ to ሀ, ሠ to ሰ, ዐ to አ, ፀ to ጸ
+  var FOLD = [[0x1210, 0x1200], [0x1280, 0x1200], [0x1220, 0x1230], [0x12d0, 0x12a0], [0x1340, 0x1338]];
+  var SECTIONS = { blog: "Blog", cs: "CS", wegoch: "ወግ", getem: "ግጥም", geez: "ግእዝ" };
+
+  var manifest = null;
+  var shards = {};
+
+  function fold(ch) {
+    var code = ch.charCodeAt(0);
+    for (var i = 0; i < FOLD.length; i++) {
+      if (code >= FOLD[i][0] && code < FOLD[i][0] + 8) {
+        return String.fromCharCode(FOLD[i][1] + code - FOLD[i][0]);
+      }
+    }
+    return ch;
+  }
+
+  function terms(text) {
+    var words = text
+      .normalize("NFKD")
+      .replace(/\p{M}/gu, "")
+      .toLowerCase()
+      .replace(/[ሀ-፿]/g, fold)
+      .match(/[\p{L}\p{N}]+/gu) || [];
+    return words.filter(function (word) {
+      return word.length > 1 || word.charCodeAt(0) > 0x7f;
+    });
+  }
+
+  function shardOf(term) {
+    var code = term.codePointAt(0);
+    if (code >= 0x1200 && code < 0x13a0) return "e" + (code & ~7).toString(16);
+    if (code < 0x80) return term[0];
+    return "u" + code.toString(16);
+  }
+
+  function fetchJSON(url) {
+    return fetch(url).then(function (response) {
+      if (!response.ok) throw new Error(url + ": " + response.status);
+      return response.json();
+    });
+  }
+
+  function loadManifest() {
+    if (!manifest) manifest = fetchJSON(ROOT + "index.json");
+    return manifest;
+  }
+
+  function loadShard(index, key) {
+    if (!(key in index.shards)) return Promise.resolve({});
+    if (!shards[key]) {
+      shards[key] = fetchJSON(ROOT + "shards/" + key + ".json?v=" + index.shards[key]);
+    }
+    return shards[key];
+  }
+
+  // Documents matching every term, best first. A term matches exactly, or as the
+  // prefix of an indexed word (Amharic attaches suffixes) at half the score.
+  function search(query) {
+    var wanted = Array.from(new Set(terms(query)));
+    if (!wanted.length) return Promise.resolve([]);
+    return loadManifest().then(function (index) {
+      var keys = Array.from(new Set(wanted.map(shardOf)));
+      return Promise.all(keys.map(function (key) { return loadShard(index, key); })).then(function (loaded) {
+        var byKey = {};
+        keys.forEach(function (key, i) { byKey[key] = loaded[i]; });
+        var totals = null;
+        wanted.forEach(function (term) {
+          var shard = byKey[shardOf(term)];
+          var scores = {};
+          Object.keys(shard).forEach(function (word) {
+            if (word.lastIndexOf(term, 0) !== 0) return;
+            var weight = word === term ? 1 : 0.5;
+            var postings = shard[word];
+            for (var i = 0; i < postings.length; i += 2) {
+              scores[postings[i]] = (scores[postings[i]] || 0) + postings[i + 1] * weight;
+            }
+          });
+          if (totals === null) {
+            totals = scores;
+            return;
+          }
+          Object.keys(totals).forEach(function (doc) {
+            if (doc in scores) totals[doc] += scores[doc];
+            else delete totals[doc];
+          });
+        });
+        return Object.keys(totals)
+          .sort(function (a, b) { return totals[b] - totals[a]; })
+          .slice(0, LIMIT)
+          .map(function (doc) {
+            var entry = index.docs[doc];
+            return { url: entry[0], title: entry[1], section: entry[2], description: entry[3] };
+          });
+      });
+    });
+  }
+
+  window.siteSearch = search;
+
+  // Wire up the search page form, keeping the query in the URL
+  var form = document.querySelector("[data-search]");
+  if (!form) return;
+  var input = form.querySelector("input");
+  var list = document.querySelector("[data-search-results]");
+  var status = document.querySelector("[data-search-status]");
+  var pending = 0;
+
+  function render(query) {
+    var ticket = ++pending;
+    search(query).then(function (results) {
+      if (ticket !== pending) return;
+      list.textContent = "";
+      status.textContent = query.trim() ? results.length + (results.length === 1 ? " result" : " results") : "";
+      results.forEach(function (result) {
+        var item = document.createElement("li");
+        var link = document.createElement("a");
+        var section = document.createElement("span");
+        var description = document.createElement("p");
+        link.href = result.url;
+        link.textContent = result.title;
+        section.className = "search-section";
+        section.textContent = SECTIONS[result.section] || result.section;
+        description.textContent = result.description;
+        item.append(link, section, description);
+        list.appendChild(item);
+      });
+    }).catch(function () {
+      if (ticket === pending) status.textContent = "Search is unavailable right now.";
+    });
+  }
+
+  form.addEventListener("submit", function (event) {
+    event.preventDefault();
+    render(input.value);
+  });
+  input.addEventListener("input", function () {
+    history.replaceState(null, "", input.value ? "?q=" + encodeURIComponent(input.value) : location.pathname);
+    render(input.value);
+  });
+
+  input.value = new URLSearchParams(location.search).get("q") || "";
+  if (input.value) render(input.value);
+})();